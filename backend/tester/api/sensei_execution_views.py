@@ -283,7 +283,7 @@ class SenseiExecutionStatusManager:
         if self.test_case and self.test_case.status == "RUNNING":
             logger.info(f"Celery task {self.task_id} completed, updating test case {self.test_case.id} to SUCCESS")
             self.test_case.status = "SUCCESS"
-            self.test_case.save()
+            self.test_case.save(update_fields=["status"])
         return Response(
             {
                 "status": "SUCCESS",
@@ -301,7 +301,7 @@ class SenseiExecutionStatusManager:
             logger.info(f"Celery task {self.task_id} failed, updating test case {self.test_case.id} to FAILURE")
             self.test_case.status = "FAILURE"
             self.test_case.error_message = error_message
-            self.test_case.save()
+            self.test_case.save(update_fields=["status", "error_message"])
         return Response(
             {
                 "status": "FAILURE",
@@ -318,7 +318,7 @@ class SenseiExecutionStatusManager:
             logger.info(f"Celery task {self.task_id} was revoked, updating test case {self.test_case.id} to CANCELLED")
             self.test_case.status = "CANCELLED"
             self.test_case.error_message = "Execution cancelled by user."
-            self.test_case.save()
+            self.test_case.save(update_fields=["status", "error_message"])
         return Response(
             {
                 "status": "CANCELLED",
@@ -360,8 +360,8 @@ def stop_sensei_execution(request: Request) -> Response:
         return Response({"error": "No test case ID provided."}, status=status.HTTP_400_BAD_REQUEST)
 
     try:
-        test_case = TestCase.objects.get(id=test_case_id)
-        if test_case.project.owner != request.user:
+        test_case = TestCase.objects.select_related("project").get(id=test_case_id)
+        if test_case.project.owner_id != request.user.id:
             return Response({"error": "You do not own this test case."}, status=status.HTTP_403_FORBIDDEN)
 
         if test_case.status != "RUNNING":
@@ -379,7 +379,7 @@ def stop_sensei_execution(request: Request) -> Response:
                 # Manually update the status to reflect cancellation
                 test_case.status = "FAILURE"
                 test_case.error_message = "Execution cancelled by user."
-                test_case.save()
+                test_case.save(update_fields=["status", "error_message"])
 
             except (ValueError, AttributeError, KeyError) as e:
                 logger.warning(f"Could not revoke Celery task {test_case.celery_task_id}: {e}")
@@ -1,10 +1,18 @@
 """Celery tasks for the tester app."""
 
+import shutil
+from pathlib import Path
+from uuid import uuid4
+
 from celery import Task, shared_task
+from kombu.exceptions import OperationalError
 
+from .base import logger
 from .test_runner import TestExecutionConfig, TestRunner
 from .tracer_generator import ProfileGenerationParams, TracerGenerator
 
+PENDING_DELETE_SUFFIX = ".pending-delete"
+
 
 @shared_task(bind=True)
 def generate_profiles_task(self: Task, task_id: int, params_dict: dict) -> None:
@@ -22,3 +30,38 @@ def execute_sensei_test_task(self: Task, config_dict: dict) -> None:
     test_runner = TestRunner()
     # Pass the Celery task instance for progress updates
     test_runner.execute_test_with_celery_progress(config, self)
+
+
+@shared_task
+def delete_directory_task(path: str) -> None:
+    """Celery task to remove a directory tree that was moved aside when its owner was deleted."""
+    try:
+        shutil.rmtree(path)
+        logger.info(f"Deleted directory: {path}")
+    except FileNotFoundError:
+        logger.info(f"Directory already removed: {path}")
+    except OSError:
+        logger.exception(f"Error deleting directory {path}")
+
+
+def remove_directory_in_background(path: Path) -> None:
+    """Move a directory tree aside and queue its removal in a Celery worker.
+
+    The rename hides the contents from later requests while the removal is pending. If the
+    tree cannot be moved aside or the broker is unreachable, it is removed in-process instead.
+    """
+    pending_path = path.with_name(f"{path.name}.{uuid4().hex}{PENDING_DELETE_SUFFIX}")
+    try:
+        path.rename(pending_path)
+    except FileNotFoundError:
+        return
+    except OSError:
+        logger.warning(f"Could not move directory {path} aside, removing it in-process")
+        shutil.rmtree(path, ignore_errors=True)
+        return
+
+    try:
+        delete_directory_task.delay(str(pending_path))
+    except OperationalError:
+        logger.warning(f"Could not queue deletion of {path}, removing it in-process")
+        shutil.rmtree(pending_path, ignore_errors=True)
@@ -24,7 +24,7 @@ class TestCaseAccessPermission(BasePermission):
 
         Allows access if the project is public or the user is the project owner.
         """
-        return obj.project.public or (request.user.is_authenticated and request.user == obj.project.owner)
+        return obj.project.public or (request.user.is_authenticated and obj.project.owner_id == request.user.id)
 
 
 class TestCaseViewSet(viewsets.ModelViewSet):
@@ -61,7 +61,7 @@ class TestCaseViewSet(viewsets.ModelViewSet):
 
     def get_object(self) -> TestCase:
         """Override get_object to handle permissions correctly."""
-        obj = get_object_or_404(TestCase, pk=self.kwargs["pk"])
+        obj = get_object_or_404(TestCase.objects.select_related("project"), pk=self.kwargs["pk"])
         self.check_object_permissions(self.request, obj)
         return obj
 
@@ -34,13 +34,13 @@ class TestFilePermission(BasePermission):
 
         Allows access if the project is public or the user is the project owner.
         """
-        return obj.project.public or (request.user.is_authenticated and request.user == obj.project.owner)
+        return obj.project.public or (request.user.is_authenticated and obj.project.owner_id == request.user.id)
 
 
 class TestFileViewSet(viewsets.ModelViewSet):
     """API ViewSet for managing TestFiles."""
 
-    queryset = TestFile.objects.all()
+    queryset = TestFile.objects.select_related("project")
     serializer_class = TestFileSerializer
     parser_classes: ClassVar[list[Any]] = [MultiPartParser, FormParser, JSONParser]
     permission_classes: ClassVar[list[type[BasePermission]]] = [permissions.IsAuthenticated, TestFilePermission]
@@ -87,7 +87,7 @@ class TestRunner:
         # Only stop if the test is currently running
         if test_case.status == "RUNNING":
             test_case.status = "STOPPED"
-            test_case.save()
+            test_case.save(update_fields=["status"])
 
             # If we have a process ID, try to terminate the process
             if test_case.process_id:
@@ -115,7 +115,6 @@ class TestRunner:
         local_test_case = TestCase.objects.get(id=test_case_id)
 
         # Check if execution was stopped
-        local_test_case.refresh_from_db()
         if local_test_case.status != "RUNNING":
             logger.info("Monitoring stopped because status changed.")
             return 0
@@ -136,7 +135,7 @@ class TestRunner:
 
                 # Update both database and Celery task state
                 local_test_case.executed_conversations = executed_conversations
-                local_test_case.save()
+                local_test_case.save(update_fields=["executed_conversations"])
 
                 # Calculate progress percentage based purely on conversations
                 progress_percentage = (
@@ -296,7 +295,7 @@ class TestRunner:
         # Save the process id and mark the test as RUNNING
         test_case.process_id = process.pid
         test_case.status = "RUNNING"
-        test_case.save()
+        test_case.save(update_fields=["process_id", "status"])
 
         return process, test_case.total_conversations
 
@@ -1,14 +1,15 @@
 """TRACER profile generation core functionality."""
 
+import codecs
 import json
 import os
-import queue
 import re
+import selectors
 import shlex
 import signal
 import subprocess
-import threading
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -44,7 +45,6 @@ except ImportError:
     ConnectorResponseError = Exception
     LLMError = Exception
 
-
 from tester.api.base import logger
 
 # Import here to avoid circular imports in runtime, but linter prefers top-level
@@ -63,6 +63,64 @@ TRACER_EXCEPTION_MAPPING = {
     "TracerError": "TRACER_ERROR",
 }
 
+# Progress stages reported while parsing TRACER stdout. They are interned so that
+# comparing a freshly assigned stage with the previous one is an identity check.
+STAGE_INITIALIZING_AGENT = sys.intern("Initializing Agent")
+STAGE_EXPLORATION_PHASE = sys.intern("Exploration Phase")
+STAGE_ANALYSIS_PHASE = sys.intern("Analysis Phase")
+STAGE_WORKFLOW_INFERENCE = sys.intern("Analyzing: Workflow Inference")
+STAGE_GENERATING_PROFILES = sys.intern("Analyzing: Generating Profiles")
+STAGE_CONVERSATION_PARAMETERS = sys.intern("Analyzing: Generating Conversation Parameters")
+STAGE_BUILDING_PROFILES = sys.intern("Analyzing: Building Profiles")
+STAGE_FINALIZING_REPORT = sys.intern("Finalizing Report")
+
+# Substrings of the TRACER stdout lines that move progress to a fixed stage, per phase and in
+# the order they are checked, mapped to the stage and percentage they report
+_EXPLORATION_STEPS: dict[str, tuple[str, int]] = {
+    "Initializing Chatbot Exploration Agent": (STAGE_INITIALIZING_AGENT, 5),
+    "--- Starting Chatbot Exploration Phase ---": (STAGE_EXPLORATION_PHASE, 10),
+}
+_ANALYSIS_STEPS: dict[str, tuple[str, int]] = {
+    "---   Starting Analysis Phase   ---": (STAGE_ANALYSIS_PHASE, 55),
+    "Step 1: Workflow structure inference": (STAGE_WORKFLOW_INFERENCE, 65),
+    "Step 2: User profile generation": (STAGE_GENERATING_PROFILES, 75),
+    "Step 3: Conversation parameters generation": (STAGE_CONVERSATION_PARAMETERS, 85),
+    "Step 4: Building user profiles": (STAGE_BUILDING_PROFILES, 95),
+}
+_FINALIZATION_STEPS: dict[str, tuple[str, int]] = {
+    "---   Final Report Summary   ---": (STAGE_FINALIZING_REPORT, 98),
+}
+# Exploration sessions report a progress computed from the session counter instead
+_EXPLORATION_SESSION_MARKER = "=== Starting Exploration Session"
+
+# Matches any line carrying one of the markers above, so other TRACER output is skipped cheaply
+_PROGRESS_MARKER_PATTERN = re.compile(
+    "|".join(
+        re.escape(marker)
+        for marker in (*_EXPLORATION_STEPS, _EXPLORATION_SESSION_MARKER, *_ANALYSIS_STEPS, *_FINALIZATION_STEPS)
+    )
+)
+
+# TRACER command-line flags, interned once instead of rebuilt for every command
+_TRACER_BIN = sys.intern("tracer")
+_FLAG_SESSIONS = sys.intern("-s")
+_FLAG_TURNS = sys.intern("-n")
+_FLAG_TECHNOLOGY = sys.intern("--technology")
+_FLAG_CONNECTOR_PARAMS = sys.intern("--connector-params")
+_FLAG_MODEL = sys.intern("-m")
+_FLAG_PROFILE_MODEL = sys.intern("-pm")
+_FLAG_OUTPUT = sys.intern("-o")
+_FLAG_GRAPH_FORMAT = sys.intern("--graph-format")
+_VERBOSITY_FLAGS: dict[str, tuple[str, ...]] = {
+    "verbose": (sys.intern("-v"),),
+    "debug": (sys.intern("-vv"),),
+}
+
+# Maximum number of bytes read from a TRACER pipe per selector event
+PIPE_READ_SIZE = 65536
+# Seconds to wait for TRACER output before checking for cancellation or exit
+OUTPUT_POLL_TIMEOUT = 0.5
+
 
 class TracerGenerationCancelledError(Exception):
     """Raised when a TRACER generation task is cancelled before starting."""
@@ -81,9 +139,35 @@ class ProfileGenerationParams:
     graph_format: str = "all"
 
 
+@dataclass
+class _PipeOutput:
+    """Incrementally decoded output of one TRACER pipe."""
+
+    is_stdout: bool
+    decoder: codecs.IncrementalDecoder = field(
+        default_factory=lambda: codecs.getincrementaldecoder("utf-8")(errors="replace")
+    )
+    pending: str = ""
+
+    def feed(self, chunk: bytes) -> list[str]:
+        """Decode a chunk and return the lines it completed; an empty chunk flushes the remainder."""
+        self.pending += self.decoder.decode(chunk, final=not chunk)
+        *lines, self.pending = self.pending.split("\n")
+        completed = [f"{line}\n" for line in lines]
+        if not chunk and self.pending:
+            completed.append(self.pending)
+            self.pending = ""
+        return completed
+
+
 class TracerGenerator:
     """Handles TRACER profile generation execution with real TRACER integration."""
 
+    def __init__(self) -> None:
+        """Initialize per-run progress parsing state."""
+        # Last (current, total) exploration session seen in TRACER output
+        self._last_exploration: tuple[int, int] = (0, 0)
+
     @staticmethod
     def get_api_key_env_var(provider: str | None) -> str:
         """Get the environment variable name for the given LLM provider."""
@@ -156,7 +240,8 @@ class TracerGenerator:
 
     def _initialize_task(self, task_id: int, celery_task: "Task | None" = None) -> ProfileGenerationTask:
         """Initialize and update task status."""
-        task = ProfileGenerationTask.objects.get(id=task_id)
+        # The worker reads the project's connector for the command line, so load it with the task
+        task = ProfileGenerationTask.objects.select_related("project__chatbot_connector", "execution").get(id=task_id)
         if task.status in {"CANCELLING", "CANCELLED"}:
             task.status = "CANCELLED"
             task.stage = "CANCELLED"
@@ -312,7 +397,7 @@ class TracerGenerator:
         """Execute TRACER command and process results."""
         try:
             self._validate_project_configuration(task.project)
-            output_dir = self._setup_output_directory(execution)
+            output_dir, output_dir_str = self._setup_output_directory(execution)
 
             # Update progress
             task.progress_percentage = 20
@@ -329,7 +414,7 @@ class TracerGenerator:
                     },
                 )
 
-            success = self._run_tracer_command(task, execution, params, output_dir, celery_task)
+            success = self._run_tracer_command(task, execution, params, output_dir_str, celery_task)
 
             if success:
                 self._post_process_results(task, execution, output_dir, celery_task)
@@ -367,18 +452,23 @@ class TracerGenerator:
             msg = "Project must have an exploration model configured"
             raise ValueError(msg)
 
-    def _setup_output_directory(self, execution: ProfileExecution) -> Path:
-        """Set up and return the output directory for TRACER results."""
+    def _setup_output_directory(self, execution: ProfileExecution) -> tuple[Path, str]:
+        """Set up the output directory for TRACER results.
+
+        Returns:
+            The output directory path and its string form, computed once for the TRACER command line.
+        """
         output_dir = Path(settings.MEDIA_ROOT) / execution.profiles_directory
-        output_dir.mkdir(parents=True, exist_ok=True)
-        return output_dir
+        if not output_dir.is_dir():
+            output_dir.mkdir(parents=True, exist_ok=True)
+        return output_dir, str(output_dir)
 
     def _run_tracer_command(
         self,
         task: ProfileGenerationTask,
         execution: ProfileExecution,
         params: ProfileGenerationParams,
-        output_dir: Path,
+        output_dir: str,
         celery_task: "Task | None" = None,
     ) -> bool:
         """Execute the TRACER command and handle output."""
@@ -439,44 +529,30 @@ class TracerGenerator:
         profile_model = config["profile_model"]
         output_dir = config["output_dir"]
 
+        # Custom connectors pass a string like "config_path=./path", others a JSON-encoded dict
+        connector_arg = connector_params if isinstance(connector_params, str) else json.dumps(connector_params)
+        profile_model_args = (_FLAG_PROFILE_MODEL, profile_model) if profile_model else ()
+
         cmd = [
-            "tracer",
-            "-s",
+            _TRACER_BIN,
+            _FLAG_SESSIONS,
             str(params.conversations),
-            "-n",
+            _FLAG_TURNS,
             str(params.turns),
-            "--technology",
+            _FLAG_TECHNOLOGY,
             technology,
-            "--connector-params",
+            _FLAG_CONNECTOR_PARAMS,
+            connector_arg,
+            _FLAG_MODEL,
+            exploration_model,
+            *profile_model_args,
+            _FLAG_OUTPUT,
+            output_dir,
+            _FLAG_GRAPH_FORMAT,
+            params.graph_format,
+            *_VERBOSITY_FLAGS.get(params.verbosity, ()),
         ]
 
-        # Handle connector_params based on type
-        if isinstance(connector_params, str):
-            # For custom connectors, connector_params is a string like "config_path=./path"
-            cmd.append(connector_params)
-        else:
-            # For other connectors, connector_params is a dict that should be JSON-encoded
-            cmd.append(json.dumps(connector_params))
-
-        cmd.extend(["-m", exploration_model])
-
-        if profile_model:
-            cmd.extend(["-pm", profile_model])
-        cmd.extend(
-            [
-                "-o",
-                str(output_dir),
-                "--graph-format",
-                params.graph_format,
-            ]
-        )
-
-        # Add verbosity flags
-        if params.verbosity == "verbose":
-            cmd.append("-v")
-        elif params.verbosity == "debug":
-            cmd.append("-vv")
-
         logger.info(f"Executing TRACER command: {shlex.join(cmd)}")
         return cmd
 
@@ -491,7 +567,7 @@ class TracerGenerator:
 
         return env
 
-    def _execute_subprocess(  # noqa: PLR0915
+    def _execute_subprocess(
         self,
         task: ProfileGenerationTask,
         execution: ProfileExecution,
@@ -506,23 +582,14 @@ class TracerGenerator:
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True,
                 env=env,
-                bufsize=1,
-                universal_newlines=True,
             )
             execution.process_id = process.pid
             execution.save(update_fields=["process_id"])
 
-            full_stdout = self._handle_process_output(task, execution, process, celery_task)
+            full_stdout, full_stderr = self._handle_process_output(task, execution, process, celery_task)
             process.wait()
 
-            full_stderr_lines = []
-            if process.stderr:
-                full_stderr_lines = process.stderr.readlines()
-
-            full_stderr = "".join(full_stderr_lines)
-
             # Store TRACER output for debugging
             execution.tracer_stdout = "".join(full_stdout)
             execution.tracer_stderr = full_stderr
@@ -654,54 +721,74 @@ class TracerGenerator:
         execution: ProfileExecution,
         process: subprocess.Popen,
         celery_task: "Task | None" = None,
-    ) -> list[str]:
-        """Handle process output and update progress."""
-        full_stdout = []
-        output_queue, reader_thread = self._start_stdout_reader(process)
-
-        while True:
-            try:
-                line = output_queue.get(timeout=0.5)
-            except queue.Empty:
-                if self._should_stop_waiting_for_output(task, execution, process, reader_thread):
-                    break
-                continue
-
-            if line is None:
-                break
+    ) -> tuple[list[str], str]:
+        """Handle process output and update progress.
 
-            full_stdout.append(line)
-            if self._process_tracer_output_line(task, execution, process, line, celery_task):
-                break
+        Both pipes are drained from a single selector loop, so a chatty stderr can never
+        block TRACER while we are waiting for stdout.
 
-        return full_stdout
-
-    def _start_stdout_reader(self, process: subprocess.Popen) -> tuple[queue.Queue[str | None], threading.Thread]:
-        """Start a background reader for TRACER stdout."""
-        output_queue: queue.Queue[str | None] = queue.Queue()
-
-        def read_stdout() -> None:
-            if process.stdout:
-                for stdout_line in iter(process.stdout.readline, ""):
-                    output_queue.put(stdout_line)
-            output_queue.put(None)
+        Returns:
+            The stdout lines and the full stderr text.
+        """
+        full_stdout: list[str] = []
+        stderr_lines: list[str] = []
+        stop_requested = False
+
+        with selectors.DefaultSelector() as selector:
+            self._register_output_pipes(selector, process)
+            while selector.get_map():
+                events = selector.select(timeout=OUTPUT_POLL_TIMEOUT)
+                if not events:
+                    if not stop_requested:
+                        stop_requested = self._should_stop_waiting_for_output(task, execution, process)
+                    if process.poll() is not None:
+                        break
+                    continue
+
+                for key, _ in events:
+                    lines = self._read_pipe_lines(selector, key)
+                    if not key.data.is_stdout:
+                        stderr_lines.extend(lines)
+                        continue
+
+                    for line in lines:
+                        full_stdout.append(line)
+                        if not stop_requested:
+                            stop_requested = self._process_tracer_output_line(
+                                task, execution, process, line, celery_task
+                            )
+
+        return full_stdout, "".join(stderr_lines)
+
+    def _register_output_pipes(self, selector: selectors.BaseSelector, process: subprocess.Popen) -> None:
+        """Switch the TRACER pipes to non-blocking mode and watch them for reads."""
+        for stream, is_stdout in ((process.stdout, True), (process.stderr, False)):
+            if stream:
+                os.set_blocking(stream.fileno(), False)
+                selector.register(stream.fileno(), selectors.EVENT_READ, data=_PipeOutput(is_stdout))
+
+    def _read_pipe_lines(self, selector: selectors.BaseSelector, key: selectors.SelectorKey) -> list[str]:
+        """Read the available bytes from a ready pipe and return the lines they complete."""
+        try:
+            chunk = os.read(key.fd, PIPE_READ_SIZE)
+        except BlockingIOError:
+            return []
 
-        reader_thread = threading.Thread(target=read_stdout, daemon=True)
-        reader_thread.start()
-        return output_queue, reader_thread
+        if not chunk:
+            selector.unregister(key.fd)
+        return key.data.feed(chunk)
 
     def _should_stop_waiting_for_output(
         self,
         task: ProfileGenerationTask,
         execution: ProfileExecution,
         process: subprocess.Popen,
-        reader_thread: threading.Thread,
     ) -> bool:
-        """Return true when output handling should stop while waiting for stdout."""
+        """Return true, terminating TRACER, when the user cancelled while we waited for output."""
         if self._is_cancellation_requested(task, execution):
             self._terminate_tracer_subprocess(process)
             return True
-        return process.poll() is not None and not reader_thread.is_alive()
+        return False
 
     def _process_tracer_output_line(
         self,
@@ -769,15 +856,21 @@ class TracerGenerator:
         self, task: ProfileGenerationTask, line: str, celery_task: "Task | None" = None
     ) -> None:
         """Parse a line of TRACER output and update the task progress."""
+        # Most TRACER output is chatter; skip the phase handlers unless a marker is present
+        if _PROGRESS_MARKER_PATTERN.search(line) is None:
+            return
+
         try:
             line = line.strip()
+            previous_progress = (task.stage, task.progress_percentage)
             progress_updated = (
                 self._handle_exploration_phase(task, line)
                 or self._handle_analysis_phase(task, line)
                 or self._handle_finalization_phase(task, line)
             )
 
-            if progress_updated:
+            # Repeated markers leave the stage untouched, so skip the UPDATE for them
+            if progress_updated and (task.stage, task.progress_percentage) != previous_progress:
                 task.save(update_fields=["stage", "progress_percentage"])
 
                 # Update Celery task state if available
@@ -793,59 +886,44 @@ class TracerGenerator:
             logger.debug(f"Non-critical: Could not parse TRACER progress from output for task {task.id}: {e!s}")
 
     def _handle_exploration_phase(self, task: ProfileGenerationTask, line: str) -> bool:
-        if "Initializing Chatbot Exploration Agent" in line:
-            task.stage = "Initializing Agent"
-            task.progress_percentage = 5
-            return True
-        if "--- Starting Chatbot Exploration Phase ---" in line:
-            task.stage = "Exploration Phase"
-            task.progress_percentage = 10
-            return True
-        if "=== Starting Exploration Session" in line:
-            self._update_exploration_progress(task, line)
+        if self._apply_progress_step(task, line, _EXPLORATION_STEPS):
             return True
+        if _EXPLORATION_SESSION_MARKER in line:
+            return self._update_exploration_progress(task, line)
         return False
 
     def _handle_analysis_phase(self, task: ProfileGenerationTask, line: str) -> bool:
-        if "---   Starting Analysis Phase   ---" in line:
-            task.stage = "Analysis Phase"
-            task.progress_percentage = 55
-            return True
-        if "Step 1: Workflow structure inference" in line:
-            task.stage = "Analyzing: Workflow Inference"
-            task.progress_percentage = 65
-            return True
-        if "Step 2: User profile generation" in line:
-            task.stage = "Analyzing: Generating Profiles"
-            task.progress_percentage = 75
-            return True
-        if "Step 3: Conversation parameters generation" in line:
-            task.stage = "Analyzing: Generating Conversation Parameters"
-            task.progress_percentage = 85
-            return True
-        if "Step 4: Building user profiles" in line:
-            task.stage = "Analyzing: Building Profiles"
-            task.progress_percentage = 95
-            return True
-        return False
+        return self._apply_progress_step(task, line, _ANALYSIS_STEPS)
 
     def _handle_finalization_phase(self, task: ProfileGenerationTask, line: str) -> bool:
-        if "---   Final Report Summary   ---" in line:
-            task.stage = "Finalizing Report"
-            task.progress_percentage = 98
-            return True
+        return self._apply_progress_step(task, line, _FINALIZATION_STEPS)
+
+    def _apply_progress_step(self, task: ProfileGenerationTask, line: str, steps: dict[str, tuple[str, int]]) -> bool:
+        """Set the stage and progress of the first step whose marker the line contains."""
+        for marker, (stage, progress) in steps.items():
+            if marker in line:
+                task.stage = stage
+                task.progress_percentage = progress
+                return True
         return False
 
-    def _update_exploration_progress(self, task: ProfileGenerationTask, line: str) -> None:
-        """Update progress during exploration phase."""
+    def _update_exploration_progress(self, task: ProfileGenerationTask, line: str) -> bool:
+        """Update progress during exploration phase, returning true if the session changed."""
         match = re.search(r"Exploration Session (\d+)/(\d+)", line)
-        if match:
-            current_session = int(match.group(1))
-            total_sessions_from_log = int(match.group(2))
-            task.stage = f"Exploring: Session {current_session}/{total_sessions_from_log}"
-            # Exploration is from 10% to 50%
-            progress = 10 + int((current_session / total_sessions_from_log) * 40)
-            task.progress_percentage = progress
+        if not match:
+            return False
+
+        current_session = int(match.group(1))
+        total_sessions_from_log = int(match.group(2))
+        if (current_session, total_sessions_from_log) == self._last_exploration:
+            return False
+
+        self._last_exploration = (current_session, total_sessions_from_log)
+        task.stage = f"Exploring: Session {current_session}/{total_sessions_from_log}"
+        # Exploration is from 10% to 50%
+        progress = 10 + int((current_session / total_sessions_from_log) * 40)
+        task.progress_percentage = progress
+        return True
 
     def _generate_user_friendly_error_message(self, error_type: str) -> str:
         """Generate user-friendly error messages based on the error type.
@@ -1,196 +1,95 @@
 """TRACER result processing and report parsing functionality."""
 
+import functools
+import io
+import itertools
 import json
+import os
 import re
 import shutil
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import yaml
 from django.conf import settings
+from django.db import transaction
 
 from tester.api.base import logger
 from tester.models import (
     OriginalTracerProfile,
     ProfileExecution,
+    Project,
     TestFile,
     TracerAnalysisResult,
 )
 
+# Report patterns, compiled once and shared by every parsed line
+_RE_FUNCS = re.compile(r"\((\d+)\s+functions?\)")
+_RE_FUNCTIONALITIES = re.compile(r"\*\*(\d+)\s+functionalities\*\*")
+_RE_CATEGORIES = re.compile(r"across \*\*(\d+)\s+categories\*\*")
+_RE_TABLE_COST = re.compile(r"\$([0-9]*\.?[0-9]+)\s*USD")
+_RE_COST_AMOUNT = re.compile(r"[0-9]+\.?[0-9]*")
 
-class TracerResultsProcessor:
-    """Handles processing of TRACER execution results and report parsing."""
-
-    def process_tracer_results_dual_storage(self, execution: ProfileExecution, output_dir: Path) -> None:
-        """Process TRACER results with dual storage: editable + read-only originals.
-
-        TRACER (invoked with --graph-format all) creates workflow_graph.svg/png/pdf in the output
-        directory.  We move whichever ones exist into the analysis directory and record their
-        paths in TracerAnalysisResult so the frontend dropdown shows only available formats.
-        """
-        # Create directory structure
-        profiles_dir = output_dir / "profiles"
-        originals_dir = output_dir / "originals"
-        analysis_dir = output_dir / "analysis"
-
-        originals_dir.mkdir(exist_ok=True)
-        analysis_dir.mkdir(exist_ok=True)
+# Reports are streamed through a large buffer; the format is sniffed from a bounded header only
+REPORT_READ_BUFFER_SIZE = 131072
+FORMAT_DETECTION_CHARS = 2048
+TXT_REPORT_MARKER = "=== CHATBOT FUNCTIONALITY ANALYSIS ==="
+CATEGORY_SECTION_HEADER = "## FUNCTIONALITIES (By Category)"
 
-        # Create editable profiles directory for TestFiles
-        editable_profiles_dir = self._create_editable_profiles_directory(execution)
-        profile_count = self._process_profile_files(execution, profiles_dir, originals_dir, editable_profiles_dir)
-
-        # Update execution with profile count
-        execution.generated_profiles_count = profile_count
-        execution.save()
-
-        # Process analysis files and create analysis result
-        self._process_analysis_files(execution, output_dir, analysis_dir)
-
-        logger.info(f"Processed {profile_count} profiles for execution {execution.execution_name}")
-
-    def _create_editable_profiles_directory(self, execution: ProfileExecution) -> Path:
-        """Create the editable profiles directory structure."""
-        project = execution.project
-
-        editable_profiles_dir = Path(project.get_project_path()) / "profiles"
-        editable_profiles_dir.mkdir(parents=True, exist_ok=True)
-        return editable_profiles_dir
-
-    def _process_profile_files(
-        self,
-        execution: ProfileExecution,
-        profiles_dir: Path,
-        originals_dir: Path,
-        editable_profiles_dir: Path,
-    ) -> int:
-        """Process each generated profile file and return count."""
-        profile_count = 0
-
-        if not profiles_dir.exists():
-            return profile_count
-
-        for yaml_file in profiles_dir.glob("*.yaml"):
-            self._process_single_profile(execution, yaml_file, originals_dir, editable_profiles_dir)
-            profile_count += 1
-
-        return profile_count
-
-    def _process_single_profile(
-        self,
-        execution: ProfileExecution,
-        yaml_file: Path,
-        originals_dir: Path,
-        editable_profiles_dir: Path,
-    ) -> None:
-        """Process a single profile file."""
-        # Read original content
-        with yaml_file.open("r", encoding="utf-8") as f:
-            original_content = f.read()
-
-        # Store read-only original for TRACER dashboard
-        OriginalTracerProfile.objects.create(
-            execution=execution, original_filename=yaml_file.name, original_content=original_content
-        )
-
-        # Copy original to originals directory
-        shutil.copy(yaml_file, originals_dir / yaml_file.name)
-
-        # Create editable copy for TestFile
-        self._create_editable_test_file(execution, yaml_file, editable_profiles_dir)
-
-    def _create_editable_test_file(
-        self,
-        execution: ProfileExecution,
-        yaml_file: Path,
-        editable_profiles_dir: Path,
-    ) -> None:
-        """Create an editable TestFile from the profile."""
-        project = execution.project
-
-        # Copy to editable location
-        editable_file_path = editable_profiles_dir / yaml_file.name
-        shutil.copy(yaml_file, editable_file_path)
-
-        # Create TestFile with proper file reference
-        relative_path = project.get_relative_project_path("profiles", yaml_file.name).as_posix()
-        test_file = TestFile(project=project, execution=execution)
-        test_file.file.name = relative_path
-        test_file.save()
-
-    def _process_analysis_files(
-        self,
-        execution: ProfileExecution,
-        output_dir: Path,
-        analysis_dir: Path,
-    ) -> None:
-        """Process analysis files and create TracerAnalysisResult."""
-        # Move workflow graphs
-        final_graph_paths = self._move_workflow_graphs(output_dir, analysis_dir)
-
-        # Process report files
-        final_report_path, report_metadata = self._process_report_files(output_dir, analysis_dir)
-
-        # Create analysis result record
-        TracerAnalysisResult.objects.create(
-            execution=execution,
-            report_file_path=final_report_path or "",
-            workflow_graph_svg_path=final_graph_paths.get("svg", ""),
-            workflow_graph_png_path=final_graph_paths.get("png", ""),
-            workflow_graph_pdf_path=final_graph_paths.get("pdf", ""),
-            total_interactions=report_metadata.get("total_interactions", 0),
-            unique_paths_discovered=report_metadata.get("unique_paths", 0),
-            categories_count=report_metadata.get("categories_count", 0),
-            estimated_cost_usd=report_metadata.get("estimated_cost_usd", 0.0),
-        )
+# Rows per INSERT when storing the generated profiles
+PROFILE_BULK_CREATE_BATCH_SIZE = 500
+# Threads used to copy generated profiles; the work is I/O bound
+PROFILE_IO_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
 
-    def _move_workflow_graphs(self, output_dir: Path, analysis_dir: Path) -> dict[str, str]:
-        """Move workflow graph files and return their paths."""
-        final_graph_paths: dict[str, str] = {}
 
-        # Handle possible graph formats generated by TRACER
-        for ext in ("svg", "png", "pdf"):
-            candidate = output_dir / f"workflow_graph.{ext}"
-            if candidate.exists():
-                dest = analysis_dir / f"workflow_graph.{ext}"
-                shutil.move(candidate, dest)
-                # Store path relative to MEDIA_ROOT
-                final_graph_paths[ext] = str(dest.relative_to(Path(settings.MEDIA_ROOT)))
-                logger.info(f"Moved workflow_graph.{ext} to {dest}")
+def _parse_estimated_cost(line: str) -> float | None:
+    """Return the amount of a line like "Estimated cost: $0.1602 USD", or None if it has none."""
+    _, marker, rest = line.partition("Estimated cost:")
+    rest = rest.lstrip()
+    if not marker or not rest.startswith("$"):
+        return None
 
-        return final_graph_paths
+    amount, usd, _ = rest[1:].partition("USD")
+    amount = amount.strip()
+    if not usd or not _RE_COST_AMOUNT.fullmatch(amount):
+        return None
+    return float(amount)
 
-    def _process_report_files(self, output_dir: Path, analysis_dir: Path) -> tuple[str | None, dict[str, int | float]]:
-        """Process report files and return final path and metadata."""
-        readme_path = output_dir / "README.md"
-        report_txt_path = output_dir / "report.txt"
 
-        final_report_path = None
-        report_metadata: dict[str, int | float] = {}
-        report_source_path = None
+def _link_or_copy(src: Path, dst: Path) -> None:
+    """Hardlink ``src`` to ``dst``, copying instead when linking is not possible.
 
-        # Prioritize report.txt, fall back to README.md
-        if report_txt_path.exists():
-            report_source_path = report_txt_path
-            logger.info(f"Found report.txt, parsing metadata from: {report_txt_path}")
-        elif readme_path.exists():
-            report_source_path = readme_path
-            logger.info(f"Found README.md, parsing metadata from: {readme_path}")
+    Only use this for read-only destinations: both paths share the same inode afterwards.
+    """
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
 
-        if report_source_path:
-            report_metadata = TracerReportParser().parse_report_metadata(report_source_path)
-            # Move the report file to the analysis directory
-            final_report_dest = analysis_dir / "report.md"
-            shutil.move(report_source_path, final_report_dest)
-            # Use relative path for storage
-            final_report_path = str(final_report_dest.relative_to(Path(settings.MEDIA_ROOT)))
 
-        return final_report_path, report_metadata
+def _move_file(src: Path, dst: Path) -> None:
+    """Rename ``src`` to ``dst``, falling back to a copying move across filesystems."""
+    try:
+        src.replace(dst)
+    except OSError:
+        shutil.move(src, dst)
 
 
 class TracerReportParser:
     """Handles parsing of TRACER report files to extract metadata."""
 
-    def parse_report_metadata(self, report_path: Path) -> dict[str, int | float]:
-        """Parse TRACER report files to extract metadata."""
+    def parse_report_metadata(
+        self, report_path: Path, *, has_functionalities_json: bool | None = None
+    ) -> dict[str, int | float]:
+        """Parse TRACER report files to extract metadata.
+
+        Args:
+            report_path: The report.txt or README.md file to parse.
+            has_functionalities_json: Whether functionalities.json sits next to the report, when the
+                caller already knows; it is checked on disk otherwise.
+        """
         metadata: dict[str, int | float] = {
             "total_interactions": 0,
             "unique_paths": 0,
@@ -201,22 +100,26 @@ class TracerReportParser:
         try:
             # First try to parse functionalities.json if it exists (structured data)
             json_path = report_path.parent / "functionalities.json"
-            if json_path.exists():
+            if has_functionalities_json is None:
+                has_functionalities_json = json_path.exists()
+            if has_functionalities_json:
                 metadata.update(self._parse_functionalities_json(json_path))
 
-            # Parse the report for performance statistics
-            with report_path.open("r", encoding="utf-8") as f:
-                content = f.read()
-
-            # Determine if this is a .txt or .md file to use appropriate parsing logic
-            is_txt_format = report_path.suffix.lower() == ".txt" or "=== CHATBOT FUNCTIONALITY ANALYSIS ===" in content
-
-            if is_txt_format:
-                # Parse .txt format (newer TRACER reports)
-                metadata.update(self._parse_txt_format(content))
-            else:
-                # Parse .md format (older TRACER reports)
-                metadata.update(self._parse_md_format(content))
+            # Stream the report for performance statistics instead of reading it whole
+            with report_path.open("r", encoding="utf-8", buffering=REPORT_READ_BUFFER_SIZE) as f:
+                # Determine if this is a .txt or .md file to use appropriate parsing logic
+                if report_path.suffix.lower() == ".txt":
+                    # Parse .txt format (newer TRACER reports)
+                    metadata.update(self._parse_txt_format(f))
+                else:
+                    # Complete the header's last line so no line is split between the header and the rest
+                    head = f.read(FORMAT_DETECTION_CHARS) + f.readline()
+                    lines = itertools.chain(io.StringIO(head), f)
+                    if TXT_REPORT_MARKER in head:
+                        metadata.update(self._parse_txt_format(lines))
+                    else:
+                        # Parse .md format (older TRACER reports)
+                        metadata.update(self._parse_md_format(lines))
 
             logger.info(f"Parsed TRACER report metadata: {metadata}")
 
@@ -225,131 +128,126 @@ class TracerReportParser:
 
         return metadata
 
-    def _parse_txt_format(self, content: str) -> dict[str, int | float]:
-        """Parse .txt format TRACER reports."""
+    def _parse_txt_format(self, lines: Iterable[str]) -> dict[str, int | float]:
+        """Parse .txt format TRACER reports in a single pass over the lines."""
         metadata: dict[str, int | float] = {}
-        lines = content.split("\n")
-
-        # Count categories by finding "### CATEGORY:" lines
-        category_lines = [line for line in lines if line.strip().startswith("### CATEGORY:")]
-        if category_lines:
-            metadata["categories_count"] = len(category_lines)
-
-        # Count functionalities from the category sections
-        total_functions = self._count_functionalities_from_categories(lines)
-        if total_functions > 0:
-            metadata["unique_paths"] = total_functions
-
-        # Parse token usage statistics
-        self._parse_token_statistics_txt(lines, metadata)
-
-        return metadata
-
-    def _count_functionalities_from_categories(self, lines: list[str]) -> int:
-        """Count functionalities from category sections in txt format."""
+        categories_count = 0
         total_functions = 0
 
         for line in lines:
-            if line.strip().startswith("### CATEGORY:") and "(" in line and "functions)" in line:
-                try:
-                    # Extract number of functions from pattern like "(5 functions)"
-                    match = re.search(r"\((\d+)\s+functions?\)", line)
+            stripped_line = line.strip()
+
+            # Count categories and their functionalities from lines like "### CATEGORY: X (5 functions)"
+            if stripped_line.startswith("### CATEGORY:"):
+                categories_count += 1
+                if "(" in line and "functions)" in line:
+                    match = _RE_FUNCS.search(line)
                     if match:
                         total_functions += int(match.group(1))
-                except (ValueError, AttributeError):
-                    pass
-
-        return total_functions
-
-    def _parse_token_statistics_txt(self, lines: list[str], metadata: dict[str, int | float]) -> None:
-        """Parse token usage statistics from txt format."""
-        min_parts_for_llm_calls = 2
-        for line in lines:
-            stripped_line = line.strip()
 
             # Look for total LLM calls in TOTAL TOKEN CONSUMPTION section
-            if "Total LLM calls:" in stripped_line:
-                parts = stripped_line.split(":")
-                if len(parts) >= min_parts_for_llm_calls:
-                    calls_str = parts[1].strip().replace(",", "")
-                    if calls_str.isdigit():
-                        metadata["total_llm_calls"] = int(calls_str)
+            elif "Total LLM calls:" in stripped_line:
+                self._parse_llm_calls_txt(stripped_line, metadata)
 
             # Look for estimated cost in TOTAL TOKEN CONSUMPTION section
             elif "Estimated cost:" in stripped_line and "USD" in stripped_line:
-                cost_match = re.search(r"Estimated cost:\s*\$([0-9]+\.?[0-9]*)\s*USD", stripped_line)
-                if cost_match:
-                    metadata["estimated_cost_usd"] = float(cost_match.group(1))
-
-    def _parse_md_format(self, content: str) -> dict[str, int | float]:
-        """Parse .md format TRACER reports (legacy)."""
-        metadata: dict[str, int | float] = {}
-        lines = content.split("\n")
+                cost_value = _parse_estimated_cost(stripped_line)
+                if cost_value is not None:
+                    metadata["estimated_cost_usd"] = cost_value
 
-        # Look for "X functionalities discovered" pattern and categories count
-        self._parse_functionality_counts_md(lines, metadata)
+        if categories_count:
+            metadata["categories_count"] = categories_count
+        if total_functions > 0:
+            metadata["unique_paths"] = total_functions
 
-        # Look for Performance Statistics table values
-        self._parse_performance_statistics_md(lines, metadata)
+        return metadata
 
-        # Alternative approach: Count categories from "FUNCTIONALITIES (By Category)" section
-        if metadata.get("categories_count", 0) == 0:
-            self._count_categories_from_section(content, metadata)
+    def _parse_llm_calls_txt(self, line: str, metadata: dict[str, int | float]) -> None:
+        """Parse the total LLM calls from a line like "Total LLM calls: 1,234"."""
+        min_parts_for_llm_calls = 2
+        parts = line.split(":")
+        if len(parts) >= min_parts_for_llm_calls:
+            calls_str = parts[1].strip().replace(",", "")
+            if calls_str.isdigit():
+                metadata["total_llm_calls"] = int(calls_str)
 
-        return metadata
+    def _parse_md_format(self, lines: Iterable[str]) -> dict[str, int | float]:
+        """Parse .md format TRACER reports (legacy)."""
+        metadata: dict[str, int | float] = {}
+        section_categories: int | None = None
+        in_category_section = False
 
-    def _parse_functionality_counts_md(self, lines: list[str], metadata: dict[str, int | float]) -> None:
-        """Parse functionality counts from md format."""
         for raw_line in lines:
             line = raw_line.strip()
 
-            # Search for pattern like: "**6 functionalities** discovered across **3 categories**"
-            if "functionalities** discovered" in line and "categories**" in line:
-                try:
-                    # Extract the number before "functionalities"
-                    func_match = re.search(r"\*\*(\d+)\s+functionalities\*\*", line)
-                    if func_match:
-                        metadata["unique_paths"] = int(func_match.group(1))
-
-                    # Extract the number before "categories"
-                    cat_match = re.search(r"across \*\*(\d+)\s+categories\*\*", line)
-                    if cat_match:
-                        metadata["categories_count"] = int(cat_match.group(1))
-                except (ValueError, AttributeError):
-                    pass
-
-            # Fallback: Search for just functionalities count if the combined pattern didn't match
-            elif "functionalities** discovered" in line and metadata.get("unique_paths", 0) == 0:
-                try:
-                    match = re.search(r"\*\*(\d+)\s+functionalities\*\*", line)
-                    if match:
-                        metadata["unique_paths"] = int(match.group(1))
-                except (ValueError, AttributeError):
-                    pass
-
-    def _parse_performance_statistics_md(self, lines: list[str], metadata: dict[str, int | float]) -> None:
-        """Parse performance statistics from md format."""
-        for line in lines:
-            stripped_line = line.strip()
+            # Look for "X functionalities discovered" pattern and categories count
+            self._parse_functionality_counts_md(line, metadata)
 
             # Look for Performance Statistics table values
-            if "Total LLM Calls" in stripped_line and "|" in stripped_line:
-                try:
-                    # Format: | Total LLM Calls | 76 |
-                    parts = [part.strip() for part in stripped_line.split("|")]
-                    min_markdown_table_columns = 3
-                    if len(parts) >= min_markdown_table_columns and parts[2].isdigit():
-                        metadata["total_llm_calls"] = int(parts[2])
-                except (ValueError, IndexError):
-                    pass
-
-            # Look for estimated cost in table format
-            elif "Estimated Cost" in stripped_line and "|" in stripped_line and "USD" in stripped_line:
-                self._parse_cost_from_table(stripped_line, metadata)
-
-            # Look for total estimated cost in non-table format (backup)
-            elif "Estimated cost:" in stripped_line and "USD" in stripped_line:
-                self._parse_cost_from_text(stripped_line, metadata)
+            self._parse_performance_statistics_md(line, metadata)
+
+            # Count "### CATEGORY:" lines inside the "FUNCTIONALITIES (By Category)" section
+            if CATEGORY_SECTION_HEADER in line:
+                in_category_section = True
+                section_categories = 0
+            elif in_category_section and section_categories is not None:
+                if line.startswith("### CATEGORY:"):
+                    section_categories += 1
+                elif line.startswith("## "):
+                    in_category_section = False
+
+        # Alternative approach: use the categories counted in the section
+        if metadata.get("categories_count", 0) == 0 and section_categories is not None:
+            metadata["categories_count"] = section_categories
+
+        return metadata
+
+    def _parse_functionality_counts_md(self, line: str, metadata: dict[str, int | float]) -> None:
+        """Parse functionality counts from an md format line."""
+        # Search for pattern like: "**6 functionalities** discovered across **3 categories**"
+        if "functionalities** discovered" in line and "categories**" in line:
+            try:
+                # Extract the number before "functionalities"
+                func_match = _RE_FUNCTIONALITIES.search(line)
+                if func_match:
+                    metadata["unique_paths"] = int(func_match.group(1))
+
+                # Extract the number before "categories"
+                cat_match = _RE_CATEGORIES.search(line)
+                if cat_match:
+                    metadata["categories_count"] = int(cat_match.group(1))
+            except (ValueError, AttributeError):
+                pass
+
+        # Fallback: Search for just functionalities count if the combined pattern didn't match
+        elif "functionalities** discovered" in line and metadata.get("unique_paths", 0) == 0:
+            try:
+                match = _RE_FUNCTIONALITIES.search(line)
+                if match:
+                    metadata["unique_paths"] = int(match.group(1))
+            except (ValueError, AttributeError):
+                pass
+
+    def _parse_performance_statistics_md(self, line: str, metadata: dict[str, int | float]) -> None:
+        """Parse performance statistics from an md format line."""
+        # Look for Performance Statistics table values
+        if "Total LLM Calls" in line and "|" in line:
+            try:
+                # Format: | Total LLM Calls | 76 |
+                parts = [part.strip() for part in line.split("|")]
+                min_markdown_table_columns = 3
+                if len(parts) >= min_markdown_table_columns and parts[2].isdigit():
+                    metadata["total_llm_calls"] = int(parts[2])
+            except (ValueError, IndexError):
+                pass
+
+        # Look for estimated cost in table format
+        elif "Estimated Cost" in line and "|" in line and "USD" in line:
+            self._parse_cost_from_table(line, metadata)
+
+        # Look for total estimated cost in non-table format (backup)
+        elif "Estimated cost:" in line and "USD" in line:
+            self._parse_cost_from_text(line, metadata)
 
     def _parse_cost_from_table(self, line: str, metadata: dict[str, int | float]) -> None:
         """Parse cost from markdown table format."""
@@ -359,7 +257,7 @@ class TracerReportParser:
             min_markdown_table_columns = 3
             if len(parts) >= min_markdown_table_columns:
                 cost_cell = parts[2]  # The value cell
-                cost_match = re.search(r"\$([0-9]*\.?[0-9]+)\s*USD", cost_cell)
+                cost_match = _RE_TABLE_COST.search(cost_cell)
                 if cost_match:
                     cost_value = float(cost_match.group(1))
                     metadata["estimated_cost_usd"] = cost_value
@@ -375,48 +273,19 @@ class TracerReportParser:
 
     def _parse_cost_from_text(self, line: str, metadata: dict[str, int | float]) -> None:
         """Parse cost from text format."""
-        try:
-            # Format: Estimated cost:      $0.1602 USD
-            cost_match = re.search(r"Estimated cost:\s*\$([0-9]+\.?[0-9]*)\s*USD", line)
-            if cost_match:
-                cost_value = float(cost_match.group(1))
-                # Only update if this is the total cost (usually the last/largest one)
-                if cost_value > metadata.get("estimated_cost_usd", 0.0):
-                    metadata["estimated_cost_usd"] = cost_value
-        except (ValueError, AttributeError):
-            pass
+        # Format: Estimated cost:      $0.1602 USD
+        cost_value = _parse_estimated_cost(line)
 
-    def _count_categories_from_section(self, content: str, metadata: dict[str, int | float]) -> None:
-        """Count categories from FUNCTIONALITIES section."""
-        category_section_match = re.search(r"## FUNCTIONALITIES \(By Category\)(.*?)(?=##|$)", content, re.DOTALL)
-        if category_section_match:
-            category_section = category_section_match.group(1)
-            # Count lines that start with "### CATEGORY:"
-            category_lines = [line for line in category_section.split("\n") if line.strip().startswith("### CATEGORY:")]
-            metadata["categories_count"] = len(category_lines)
+        # Only update if this is the total cost (usually the last/largest one)
+        if cost_value is not None and cost_value > metadata.get("estimated_cost_usd", 0.0):
+            metadata["estimated_cost_usd"] = cost_value
 
     def _parse_functionalities_json(self, json_path: Path) -> dict[str, int | float]:
         """Parse functionalities.json for structured metadata."""
         metadata: dict[str, int | float] = {}
         try:
             with json_path.open("r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            # Extract relevant metrics from JSON structure
-            if (
-                isinstance(data, dict)
-                and "functionalities" in data
-                and isinstance(data["functionalities"], (list, dict))
-            ):
-                metadata["unique_paths"] = len(data["functionalities"])
-
-            # Look for interaction/call counts
-            if "statistics" in data and isinstance(data.get("statistics"), dict):
-                stats = data["statistics"]
-                if "total_calls" in stats:
-                    metadata["total_interactions"] = stats["total_calls"]
-                elif "total_llm_calls" in stats:
-                    metadata["total_interactions"] = stats["total_llm_calls"]
+                metadata = self._extract_functionalities_metadata(json.load(f))
 
             logger.info(f"Parsed functionalities.json: {metadata}")
 
@@ -424,3 +293,246 @@ class TracerReportParser:
             logger.warning(f"Could not parse functionalities.json: {e!s}")
 
         return metadata
+
+    def _extract_functionalities_metadata(self, data: object) -> dict[str, int | float]:
+        """Extract the metrics we need from a fully loaded functionalities.json document."""
+        metadata: dict[str, int | float] = {}
+        if not isinstance(data, dict):
+            return metadata
+
+        # Extract relevant metrics from JSON structure
+        if "functionalities" in data and isinstance(data["functionalities"], (list, dict)):
+            metadata["unique_paths"] = len(data["functionalities"])
+
+        # Look for interaction/call counts
+        if "statistics" in data and isinstance(data.get("statistics"), dict):
+            stats = data["statistics"]
+            if "total_calls" in stats:
+                metadata["total_interactions"] = stats["total_calls"]
+            elif "total_llm_calls" in stats:
+                metadata["total_interactions"] = stats["total_llm_calls"]
+
+        return metadata
+
+
+class TracerResultsProcessor(TracerReportParser):
+    """Handles processing of TRACER execution results and report parsing."""
+
+    def process_tracer_results_dual_storage(self, execution: ProfileExecution, output_dir: Path) -> None:
+        """Process TRACER results with dual storage: editable + read-only originals.
+
+        TRACER (invoked with --graph-format all) creates workflow_graph.svg/png/pdf in the output
+        directory.  We move whichever ones exist into the analysis directory and record their
+        paths in TracerAnalysisResult so the frontend dropdown shows only available formats.
+        """
+        # Create directory structure
+        profiles_dir = output_dir / "profiles"
+        originals_dir = output_dir / "originals"
+        analysis_dir = output_dir / "analysis"
+
+        originals_dir.mkdir(exist_ok=True)
+        analysis_dir.mkdir(exist_ok=True)
+
+        # Load the project together with its owner so no profile triggers a query for them
+        execution.project = Project.objects.select_related("owner").get(pk=execution.project_id)
+
+        # Resolve the media root and the project's profiles folder once for the whole run
+        media_root = Path(settings.MEDIA_ROOT)
+        editable_profiles_rel_dir = execution.project.get_relative_project_path("profiles")
+
+        # Moving the graphs and parsing the report only touch the filesystem, so do that in the
+        # background while the profiles are ingested; all database writes stay on this thread.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            analysis_files = executor.submit(self._process_analysis_files, output_dir, analysis_dir, media_root)
+
+            # Create editable profiles directory for TestFiles
+            editable_profiles_dir = self._create_editable_profiles_directory(media_root, editable_profiles_rel_dir)
+            profile_count = self._process_profile_files(
+                execution, profiles_dir, originals_dir, editable_profiles_dir, editable_profiles_rel_dir
+            )
+
+            # Update execution with profile count
+            execution.generated_profiles_count = profile_count
+            execution.save()
+
+            final_graph_paths, final_report_path, report_metadata = analysis_files.result()
+
+        # Create analysis result record
+        TracerAnalysisResult.objects.create(
+            execution=execution,
+            report_file_path=final_report_path or "",
+            workflow_graph_svg_path=final_graph_paths.get("svg", ""),
+            workflow_graph_png_path=final_graph_paths.get("png", ""),
+            workflow_graph_pdf_path=final_graph_paths.get("pdf", ""),
+            total_interactions=report_metadata.get("total_interactions", 0),
+            unique_paths_discovered=report_metadata.get("unique_paths", 0),
+            categories_count=report_metadata.get("categories_count", 0),
+            estimated_cost_usd=report_metadata.get("estimated_cost_usd", 0.0),
+        )
+
+        logger.info(f"Processed {profile_count} profiles for execution {execution.execution_name}")
+
+    def _create_editable_profiles_directory(self, media_root: Path, editable_profiles_rel_dir: Path) -> Path:
+        """Create the editable profiles directory structure."""
+        editable_profiles_dir = media_root / editable_profiles_rel_dir
+        editable_profiles_dir.mkdir(parents=True, exist_ok=True)
+        return editable_profiles_dir
+
+    def _process_profile_files(
+        self,
+        execution: ProfileExecution,
+        profiles_dir: Path,
+        originals_dir: Path,
+        editable_profiles_dir: Path,
+        editable_profiles_rel_dir: Path,
+    ) -> int:
+        """Process each generated profile file and return count."""
+        try:
+            with os.scandir(profiles_dir) as entries:
+                yaml_files = sorted(
+                    Path(entry.path)
+                    for entry in entries
+                    if entry.name.endswith(".yaml") and entry.is_file(follow_symlinks=False)
+                )
+        except FileNotFoundError:
+            return 0
+
+        if not yaml_files:
+            return 0
+
+        # The file copies are independent blocking I/O, so overlap them on a thread pool. Renaming
+        # and the database work stay on this thread, where name collisions are resolved in order.
+        with ThreadPoolExecutor(max_workers=min(PROFILE_IO_MAX_WORKERS, len(yaml_files))) as executor:
+            contents = list(
+                executor.map(
+                    functools.partial(
+                        self._copy_profile_files,
+                        originals_dir=originals_dir,
+                        editable_profiles_dir=editable_profiles_dir,
+                    ),
+                    yaml_files,
+                )
+            )
+
+        originals: list[OriginalTracerProfile] = []
+        test_files: list[TestFile] = []
+        for yaml_file, original_content in zip(yaml_files, contents, strict=True):
+            # Store read-only original for TRACER dashboard
+            originals.append(
+                OriginalTracerProfile(
+                    execution=execution, original_filename=yaml_file.name, original_content=original_content
+                )
+            )
+            test_files.append(
+                self._create_editable_test_file(execution, yaml_file.name, editable_profiles_rel_dir, original_content)
+            )
+
+        # Store every profile in a few batched INSERTs instead of one round-trip per row
+        with transaction.atomic():
+            OriginalTracerProfile.objects.bulk_create(originals, batch_size=PROFILE_BULK_CREATE_BATCH_SIZE)
+            TestFile.objects.bulk_create(test_files, batch_size=PROFILE_BULK_CREATE_BATCH_SIZE)
+
+        return len(originals)
+
+    def _copy_profile_files(self, yaml_file: Path, originals_dir: Path, editable_profiles_dir: Path) -> str:
+        """Store the read-only and editable copies of a profile and return its content."""
+        # Read the profile once; the bytes are reused for the editable copy
+        data = yaml_file.read_bytes()
+
+        # Link original into originals directory; neither copy is ever modified
+        _link_or_copy(yaml_file, originals_dir / yaml_file.name)
+
+        # Copy to editable location; this must stay a separate file since it is rewritten in place
+        (editable_profiles_dir / yaml_file.name).write_bytes(data)
+
+        return data.decode("utf-8")
+
+    def _create_editable_test_file(
+        self, execution: ProfileExecution, filename: str, editable_profiles_rel_dir: Path, yaml_content: str
+    ) -> TestFile:
+        """Create an unsaved editable TestFile from the profile copied into the project.
+
+        ``yaml_content`` is the profile as written by ``_copy_profile_files``, so the copy is not read back.
+        """
+        # Create TestFile with proper file reference, renamed after its test name like TestFile.save does
+        test_file = TestFile(
+            project=execution.project,
+            execution=execution,
+            file=(editable_profiles_rel_dir / filename).as_posix(),
+        )
+        try:
+            test_file.canonicalize_profile_file(editable_profiles_rel_dir, yaml_content)
+        except (FileNotFoundError, yaml.YAMLError) as e:
+            logger.warning(f"Error processing TRACER profile {filename}: {e!s}")
+            test_file.is_valid = False
+        return test_file
+
+    def _process_analysis_files(
+        self,
+        output_dir: Path,
+        analysis_dir: Path,
+        media_root: Path,
+    ) -> tuple[dict[str, str], str | None, dict[str, int | float]]:
+        """Move the analysis files and return the graph paths, report path and report metadata."""
+        # List the output directory once instead of checking each candidate file
+        with os.scandir(output_dir) as entries:
+            output_files = {entry.name for entry in entries if entry.is_file()}
+
+        # Move workflow graphs
+        final_graph_paths = self._move_workflow_graphs(output_dir, analysis_dir, media_root, output_files)
+
+        # Process report files
+        final_report_path, report_metadata = self._process_report_files(
+            output_dir, analysis_dir, media_root, output_files
+        )
+
+        return final_graph_paths, final_report_path, report_metadata
+
+    def _move_workflow_graphs(
+        self, output_dir: Path, analysis_dir: Path, media_root: Path, output_files: set[str]
+    ) -> dict[str, str]:
+        """Move workflow graph files and return their paths."""
+        final_graph_paths: dict[str, str] = {}
+
+        # Handle possible graph formats generated by TRACER
+        for ext in ("svg", "png", "pdf"):
+            if f"workflow_graph.{ext}" in output_files:
+                candidate = output_dir / f"workflow_graph.{ext}"
+                dest = analysis_dir / f"workflow_graph.{ext}"
+                _move_file(candidate, dest)
+                # Store path relative to MEDIA_ROOT
+                final_graph_paths[ext] = str(dest.relative_to(media_root))
+                logger.info(f"Moved workflow_graph.{ext} to {dest}")
+
+        return final_graph_paths
+
+    def _process_report_files(
+        self, output_dir: Path, analysis_dir: Path, media_root: Path, output_files: set[str]
+    ) -> tuple[str | None, dict[str, int | float]]:
+        """Process report files and return final path and metadata."""
+        readme_path = output_dir / "README.md"
+        report_txt_path = output_dir / "report.txt"
+
+        final_report_path = None
+        report_metadata: dict[str, int | float] = {}
+        report_source_path = None
+
+        # Prioritize report.txt, fall back to README.md
+        if report_txt_path.name in output_files:
+            report_source_path = report_txt_path
+            logger.info(f"Found report.txt, parsing metadata from: {report_txt_path}")
+        elif readme_path.name in output_files:
+            report_source_path = readme_path
+            logger.info(f"Found README.md, parsing metadata from: {readme_path}")
+
+        if report_source_path:
+            report_metadata = self.parse_report_metadata(
+                report_source_path, has_functionalities_json="functionalities.json" in output_files
+            )
+            # Move the report file to the analysis directory
+            final_report_dest = analysis_dir / "report.md"
+            _move_file(report_source_path, final_report_dest)
+            # Use relative path for storage
+            final_report_path = str(final_report_dest.relative_to(media_root))
+
+        return final_report_path, report_metadata
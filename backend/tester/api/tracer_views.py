@@ -1,31 +1,75 @@
 """API views for TRACER profile generation and analysis endpoints."""
 
+import hashlib
+import itertools
+import json
+import operator
+from collections.abc import Callable, Iterator
 from datetime import UTC, datetime
 from pathlib import Path
+from uuid import uuid4
 
 from celery import current_app
 from celery.result import AsyncResult
 from cryptography.fernet import InvalidToken
 from django.conf import settings
-from django.db import models
+from django.db import models, transaction
 from django.db.utils import DatabaseError
-from django.http import FileResponse
+from django.http import FileResponse, HttpResponseBase, HttpResponseNotModified, StreamingHttpResponse
+from django.utils.http import parse_etags
 from rest_framework import status
 from rest_framework.decorators import api_view
 from rest_framework.request import Request
 from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
 
 from tester.api.base import logger
 from tester.api.tasks import generate_profiles_task
 from tester.api.tracer_generator import ProfileGenerationParams
 from tester.models import (
+    OriginalTracerProfile,
     ProfileExecution,
     ProfileGenerationTask,
     Project,
     TracerAnalysisResult,
-    cipher_suite,
+    is_relative_to_path,
 )
 
+# Executions fetched per database round-trip when streaming the dashboard list
+EXECUTIONS_CHUNK_SIZE = 200
+
+# Columns read for each row of the TRACER executions list
+EXECUTION_LIST_FIELDS = (
+    "id",
+    "execution_name",
+    "project_id",
+    "status",
+    "created_at",
+    "sessions",
+    "turns_per_session",
+    "verbosity",
+    "execution_time_minutes",
+    "generated_profiles_count",
+    "error_type",
+    "task_error_message",
+    "task_celery_task_id",
+    "has_original_profiles",
+    "has_logs",
+)
+EXECUTION_LIST_RELATED_FIELDS = {
+    "project_name": models.F("project__name"),
+    "analysis_id": models.F("analysis_result__id"),
+    "analysis_total_interactions": models.F("analysis_result__total_interactions"),
+    "analysis_coverage_percentage": models.F("analysis_result__coverage_percentage"),
+    "analysis_unique_paths_discovered": models.F("analysis_result__unique_paths_discovered"),
+    "analysis_categories_count": models.F("analysis_result__categories_count"),
+    "analysis_estimated_cost_usd": models.F("analysis_result__estimated_cost_usd"),
+    "analysis_report_file_path": models.F("analysis_result__report_file_path"),
+    "analysis_svg_path": models.F("analysis_result__workflow_graph_svg_path"),
+    "analysis_png_path": models.F("analysis_result__workflow_graph_png_path"),
+    "analysis_pdf_path": models.F("analysis_result__workflow_graph_pdf_path"),
+}
+
 
 class TracerApiKeyManager:
     """Handles API key setup for TRACER operations."""
@@ -33,17 +77,18 @@ class TracerApiKeyManager:
     @staticmethod
     def setup_api_key(project: Project) -> str | None:
         """Load and decrypt the API key for the project, returning the key if it exists."""
+        api_key_instance = project.api_key
+        if api_key_instance is None:
+            logger.warning("No API key found for project %s", project.name)
+            return None
+
         try:
-            if api_key_instance := project.api_key:
-                decrypted_key = cipher_suite.decrypt(api_key_instance.api_key_encrypted).decode()
-                logger.info(f"API key successfully loaded for project {project.name}")
-                return decrypted_key
-            logger.warning(f"No API key found for project {project.name}")
+            decrypted_key = api_key_instance.get_api_key()
         except (InvalidToken, ValueError, TypeError) as e:
-            logger.error(f"Error loading/decrypting API key for project {project.name}: {e}")
-            return None
-        else:
+            logger.error("Error loading/decrypting API key for project %s: %s", project.name, e)
             return None
+        logger.info("API key successfully loaded for project %s", project.name)
+        return decrypted_key
 
 
 class TracerProjectValidator:
@@ -52,20 +97,25 @@ class TracerProjectValidator:
     @staticmethod
     def validate_project_access(request: Request, project_id: int) -> tuple[Response | None, Project | None]:
         """Validate project exists and user has access for TRACER generation (requires ownership)."""
-        try:
-            project = Project.objects.get(id=project_id)
-            if not request.user.is_authenticated or project.owner != request.user:
-                return (
-                    Response({"error": "You do not own this project."}, status=status.HTTP_403_FORBIDDEN),
-                    None,
-                )
-        except Project.DoesNotExist:
+        # Ownership is part of the lookup, so unauthorized requests never load the project row
+        if request.user.is_authenticated:
+            project = (
+                Project.objects.select_related("chatbot_connector", "api_key")
+                .filter(id=project_id, owner=request.user)
+                .first()
+            )
+            if project is not None:
+                return None, project
+
+        if Project.objects.filter(id=project_id).exists():
             return (
-                Response({"error": "Project not found."}, status=status.HTTP_404_NOT_FOUND),
+                Response({"error": "You do not own this project."}, status=status.HTTP_403_FORBIDDEN),
                 None,
             )
-
-        return None, project
+        return (
+            Response({"error": "Project not found."}, status=status.HTTP_404_NOT_FOUND),
+            None,
+        )
 
     @staticmethod
     def validate_project_configuration(project: Project) -> Response | None:
@@ -120,26 +170,6 @@ def generate_profiles(request: Request) -> Response:
     execution_name = f"TRACER_{timestamp}"
     profiles_dir = project.get_relative_project_path("tracer_results", execution_name.lower()).as_posix()
 
-    execution = ProfileExecution.objects.create(
-        project=project,
-        execution_name=execution_name,
-        execution_type="tracer",
-        sessions=sessions,
-        turns_per_session=turns_per_session,
-        verbosity=verbosity,
-        status="RUNNING",
-        profiles_directory=profiles_dir,
-    )
-
-    # Create generation task
-    task = ProfileGenerationTask.objects.create(
-        project=project,
-        status="PENDING",
-        conversations=sessions,  # Store sessions in conversations field for compatibility
-        turns=turns_per_session,
-        execution=execution,
-    )
-
     params = ProfileGenerationParams(
         technology=project.chatbot_connector.technology,
         conversations=sessions,
@@ -149,19 +179,41 @@ def generate_profiles(request: Request) -> Response:
         api_key=api_key,
     )
 
-    # Start Celery task for asynchronous generation
-    celery_task = generate_profiles_task.delay(task.id, params.__dict__)
+    # The Celery task ID is chosen up front so it is stored with the task row in a single INSERT
+    celery_task_id = str(uuid4())
+    with transaction.atomic():
+        execution = ProfileExecution.objects.create(
+            project=project,
+            execution_name=execution_name,
+            execution_type="tracer",
+            sessions=sessions,
+            turns_per_session=turns_per_session,
+            verbosity=verbosity,
+            status="RUNNING",
+            profiles_directory=profiles_dir,
+        )
+
+        # Create generation task
+        task = ProfileGenerationTask.objects.create(
+            project=project,
+            status="PENDING",
+            conversations=sessions,  # Store sessions in conversations field for compatibility
+            turns=turns_per_session,
+            execution=execution,
+            celery_task_id=celery_task_id,
+        )
 
-    # Store the Celery task ID in the ProfileGenerationTask for progress tracking
-    task.celery_task_id = celery_task.id
-    task.save()
+        # Start the Celery task only once the rows it loads are committed
+        transaction.on_commit(
+            lambda: generate_profiles_task.apply_async(args=(task.id, params.__dict__), task_id=celery_task_id)
+        )
 
     return Response(
         {
             "message": "Profile generation started",
             "task_id": task.id,
             "execution_id": execution.id,
-            "celery_task_id": celery_task.id,
+            "celery_task_id": celery_task_id,
         },
         status=status.HTTP_202_ACCEPTED,
     )
@@ -177,7 +229,9 @@ def check_tracer_generation_status(request: Request, celery_task_id: str) -> Res
         # Try to find the associated ProfileGenerationTask for this Celery task
         generation_task = None
         try:
-            generation_task = ProfileGenerationTask.objects.get(celery_task_id=celery_task_id)
+            generation_task = ProfileGenerationTask.objects.select_related("execution").get(
+                celery_task_id=celery_task_id
+            )
         except ProfileGenerationTask.DoesNotExist:
             logger.warning(f"No ProfileGenerationTask found for Celery task ID {celery_task_id}")
 
@@ -352,6 +406,7 @@ def check_ongoing_generation(_request: Request, project_id: int) -> Response:
         ongoing_task = (
             ProfileGenerationTask.objects.filter(project_id=project_id, status__in=["PENDING", "RUNNING"])
             .order_by("-created_at")
+            .values("id", "celery_task_id", "status")
             .first()
         )
 
@@ -359,9 +414,9 @@ def check_ongoing_generation(_request: Request, project_id: int) -> Response:
             return Response(
                 {
                     "ongoing": True,
-                    "task_id": ongoing_task.id,  # Keep for backwards compatibility
-                    "celery_task_id": ongoing_task.celery_task_id,  # New Celery task ID
-                    "status": ongoing_task.status,
+                    "task_id": ongoing_task["id"],  # Keep for backwards compatibility
+                    "celery_task_id": ongoing_task["celery_task_id"],  # New Celery task ID
+                    "status": ongoing_task["status"],
                 }
             )
         return Response({"ongoing": False})
@@ -371,31 +426,45 @@ def check_ongoing_generation(_request: Request, project_id: int) -> Response:
 
 
 @api_view(["GET"])
-def get_tracer_executions(request: Request) -> Response:
-    """Get all TRACER executions for the dashboard - includes public executions."""
+def get_tracer_executions(request: Request) -> Response | StreamingHttpResponse:
+    """Get all TRACER executions for the dashboard - includes public executions.
+
+    The ``{"executions": [...]}`` document is streamed while the rows are fetched. A database error
+    before the first row still returns a 500; once streaming has started the status is already sent,
+    so the array is closed early and an ``"error"`` key is added next to it instead.
+    """
     try:
         # Filter based on user authentication and project visibility
         if request.user.is_authenticated:
             # Authenticated users see their own executions and public executions
-            executions = (
-                ProfileExecution.objects.filter(
-                    models.Q(project__public=True) | models.Q(project__owner=request.user), execution_type="tracer"
-                )
-                .select_related("project", "analysis_result")
-                .prefetch_related("generation_tasks")
-                .order_by("-created_at")
+            executions = ProfileExecution.objects.filter(
+                models.Q(project__public=True) | models.Q(project__owner=request.user), execution_type="tracer"
             )
         else:
             # Unauthenticated users only see public executions
-            executions = (
-                ProfileExecution.objects.filter(project__public=True, execution_type="tracer")
-                .select_related("project", "analysis_result")
-                .prefetch_related("generation_tasks")
-                .order_by("-created_at")
+            executions = ProfileExecution.objects.filter(project__public=True, execution_type="tracer")
+
+        # Resolve the generation task fields and the profiles/logs checks in the same query as the executions,
+        # and read plain rows so the (potentially large) log columns are never loaded
+        first_task = ProfileGenerationTask.objects.filter(execution=models.OuterRef("pk")).order_by("pk")
+        executions = (
+            executions.annotate(
+                task_error_message=models.Subquery(first_task.values("error_message")[:1]),
+                task_celery_task_id=models.Subquery(first_task.values("celery_task_id")[:1]),
+                has_original_profiles=models.Exists(
+                    OriginalTracerProfile.objects.filter(execution=models.OuterRef("pk"))
+                ),
+                has_logs=models.ExpressionWrapper(
+                    ~models.Q(tracer_stdout="") | ~models.Q(tracer_stderr=""), output_field=models.BooleanField()
+                ),
             )
+            .order_by("-created_at")
+            .values(*EXECUTION_LIST_FIELDS, **EXECUTION_LIST_RELATED_FIELDS)
+        )
 
-        data = [_build_tracer_execution_info(execution) for execution in executions]
-        return Response({"executions": data})
+        # Run the query up front so database errors still produce a JSON error response
+        rows = executions.iterator(chunk_size=EXECUTIONS_CHUNK_SIZE)
+        first_execution = next(rows, None)
 
     except (DatabaseError, OSError) as e:
         logger.error(f"Error fetching TRACER executions: {e!s}")
@@ -404,51 +473,70 @@ def get_tracer_executions(request: Request) -> Response:
             status=status.HTTP_500_INTERNAL_SERVER_ERROR,
         )
 
+    stream = rows if first_execution is None else itertools.chain((first_execution,), rows)
+    return StreamingHttpResponse(_stream_tracer_executions(stream), content_type="application/json")
+
 
-def _build_tracer_execution_info(execution: ProfileExecution) -> dict:
-    """Build execution info dictionary for TRACER executions."""
-    # Get error message and celery task ID from associated task if available
-    error_message = ""
-    celery_task_id = None
-    if execution.generation_tasks.exists():
-        task = execution.generation_tasks.first()
-        error_message = task.error_message if task.error_message else ""
-        celery_task_id = task.celery_task_id
+def _stream_tracer_executions(executions: Iterator[dict]) -> Iterator[str]:
+    """Serialize executions as a ``{"executions": [...]}`` JSON document, one row at a time."""
+    yield '{"executions": ['
+    try:
+        for index, execution in enumerate(executions):
+            if index:
+                yield ", "
+            yield json.dumps(_build_tracer_execution_info(execution), cls=JSONEncoder)
+    except DatabaseError as e:
+        # Keep the body valid JSON and let the client tell a partial list from a complete one
+        logger.error(f"Error streaming TRACER executions: {e!s}")
+        yield '], "error": "An error occurred while fetching TRACER executions."}'
+        return
+    yield "]}"
+
+
+def _build_tracer_execution_info(execution: dict) -> dict:
+    """Build execution info dictionary for TRACER executions.
+
+    The execution is a row produced by the ``values()`` query in ``get_tracer_executions``.
+    """
+    has_analysis = execution["analysis_id"] is not None
 
     execution_info = {
-        "id": execution.id,
-        "execution_name": execution.execution_name,
-        "project_name": execution.project.name,
-        "project_id": execution.project.id,
-        "status": execution.status,
-        "created_at": execution.created_at.isoformat(),
-        "sessions": execution.sessions,
-        "turns_per_session": execution.turns_per_session,
-        "verbosity": execution.verbosity,
-        "execution_time_minutes": execution.execution_time_minutes,
-        "generated_profiles_count": execution.generated_profiles_count,
-        "has_analysis": hasattr(execution, "analysis_result"),
+        "id": execution["id"],
+        "execution_name": execution["execution_name"],
+        "project_name": execution["project_name"],
+        "project_id": execution["project_id"],
+        "status": execution["status"],
+        "created_at": execution["created_at"].isoformat(),
+        "sessions": execution["sessions"],
+        "turns_per_session": execution["turns_per_session"],
+        "verbosity": execution["verbosity"],
+        "execution_time_minutes": execution["execution_time_minutes"],
+        "generated_profiles_count": execution["generated_profiles_count"],
+        "has_analysis": has_analysis,
         "analysis": None,
-        "has_logs": bool(execution.tracer_stdout or execution.tracer_stderr),
-        "has_error": execution.status == "FAILURE",
-        "error_type": execution.error_type,
-        "error_message": error_message,
-        "has_profiles": execution.original_profiles.exists(),
-        "celery_task_id": celery_task_id,
+        "has_logs": execution["has_logs"],
+        "has_error": execution["status"] == "FAILURE",
+        "error_type": execution["error_type"],
+        # Error message and celery task ID of the associated task, if any
+        "error_message": execution["task_error_message"] or "",
+        "has_profiles": execution["has_original_profiles"],
+        "celery_task_id": execution["task_celery_task_id"],
     }
 
     # Add analysis data if available
-    if hasattr(execution, "analysis_result"):
-        analysis = execution.analysis_result
+    if has_analysis:
+        available_formats = [
+            graph_format for graph_format in _GRAPH_PATH_FIELDS if execution[f"analysis_{graph_format}_path"]
+        ]
         execution_info["analysis"] = {
-            "total_interactions": analysis.total_interactions,
-            "coverage_percentage": analysis.coverage_percentage,
-            "unique_paths_discovered": analysis.unique_paths_discovered,
-            "categories_count": analysis.categories_count,
-            "estimated_cost_usd": analysis.estimated_cost_usd,
-            "has_report": bool(analysis.report_file_path),
-            "has_graph": analysis.has_any_graph,
-            "available_formats": analysis.get_available_formats(),
+            "total_interactions": execution["analysis_total_interactions"],
+            "coverage_percentage": execution["analysis_coverage_percentage"],
+            "unique_paths_discovered": execution["analysis_unique_paths_discovered"],
+            "categories_count": execution["analysis_categories_count"],
+            "estimated_cost_usd": execution["analysis_estimated_cost_usd"],
+            "has_report": bool(execution["analysis_report_file_path"]),
+            "has_graph": bool(available_formats),
+            "available_formats": available_formats,
         }
 
     return execution_info
@@ -457,18 +545,40 @@ def _build_tracer_execution_info(execution: ProfileExecution) -> dict:
 class TracerExecutionAccessValidator:
     """Validates access to TRACER execution resources."""
 
+    # Columns every TRACER detail endpoint needs for the access check and its response
+    BASE_FIELDS = ("id", "execution_type", "execution_name", "project__name", "project__public", "project__owner")
+    REPORT_FIELDS = ("analysis_result__report_file_path",)
+    GRAPH_FIELDS = (
+        "analysis_result__workflow_graph_svg_path",
+        "analysis_result__workflow_graph_png_path",
+        "analysis_result__workflow_graph_pdf_path",
+    )
+    LOG_FIELDS = ("tracer_stdout", "tracer_stderr", "status", "verbosity", "created_at", "error_type")
+
     @staticmethod
     def validate_tracer_execution_access(
-        request: Request, execution_id: int
+        request: Request, execution_id: int, only_fields: tuple[str, ...] | None = None
     ) -> tuple[Response | None, ProfileExecution | None]:
-        """Validate user access to a TRACER execution - allows public access for public projects."""
+        """Validate user access to a TRACER execution - allows public access for public projects.
+
+        When ``only_fields`` is given, only those columns are loaded on top of ``BASE_FIELDS``, so
+        endpoints that never read the large stdout/stderr logs do not fetch them.
+        """
+        executions = ProfileExecution.objects.select_related("project")
+        if only_fields is None or any(field.startswith("analysis_result__") for field in only_fields):
+            executions = executions.select_related("analysis_result")
+        if only_fields is not None:
+            executions = executions.only(*TracerExecutionAccessValidator.BASE_FIELDS, *only_fields)
+
         try:
-            execution = ProfileExecution.objects.get(id=execution_id, execution_type="tracer")
+            execution = executions.get(id=execution_id, execution_type="tracer")
         except ProfileExecution.DoesNotExist:
             return Response({"error": "Execution not found."}, status=status.HTTP_404_NOT_FOUND), None
 
         # Allow access if project is public or user is the owner
-        if execution.project.public or (request.user.is_authenticated and execution.project.owner == request.user):
+        if execution.project.public or (
+            request.user.is_authenticated and execution.project.owner_id == request.user.id
+        ):
             return None, execution
 
         return Response({"error": "You do not have access to this execution."}, status=status.HTTP_403_FORBIDDEN), None
@@ -476,19 +586,46 @@ class TracerExecutionAccessValidator:
     @staticmethod
     def validate_analysis_result_access(execution: ProfileExecution) -> Response | None:
         """Validate that execution has analysis result."""
-        if not hasattr(execution, "analysis_result"):
+        if getattr(execution, "analysis_result", None) is None:
             return Response({"error": "No analysis result found for this execution."}, status=status.HTTP_404_NOT_FOUND)
 
         return None
 
 
+def _resolve_media_path(relative_path: str) -> Path | None:
+    """Join a stored relative path onto MEDIA_ROOT, refusing paths that escape it."""
+    # MEDIA_ROOT is read per call because tests override it with override_settings
+    media_root = Path(settings.MEDIA_ROOT)
+    file_path = media_root / relative_path
+    if not is_relative_to_path(file_path, media_root):
+        logger.warning(f"Refusing to serve path outside MEDIA_ROOT: {relative_path}")
+        return None
+    return file_path
+
+
+def _wants_raw_file(request: Request) -> bool:
+    """Return whether the client asked for the file itself instead of JSON-embedded content."""
+    return request.GET.get("raw", "").lower() in {"1", "true"}
+
+
+def _serve_raw_file(file_path: Path, content_type: str) -> FileResponse | Response:
+    """Stream a file from disk without loading it into memory."""
+    try:
+        return FileResponse(file_path.open("rb"), content_type=content_type)
+    except FileNotFoundError:
+        return Response({"error": "File not found on server."}, status=status.HTTP_404_NOT_FOUND)
+
+
 @api_view(["GET"])
-def get_tracer_analysis_report(request: Request, execution_id: int) -> Response:
-    """Get the analysis report content for a TRACER execution."""
+def get_tracer_analysis_report(request: Request, execution_id: int) -> HttpResponseBase:
+    """Get the analysis report content for a TRACER execution.
+
+    With ``?raw=1`` the markdown file is streamed as is instead of being embedded in JSON.
+    """
     try:
         # Validate access
         error_response, execution = TracerExecutionAccessValidator.validate_tracer_execution_access(
-            request, execution_id
+            request, execution_id, TracerExecutionAccessValidator.REPORT_FIELDS
         )
         if error_response:
             return error_response
@@ -503,20 +640,11 @@ def get_tracer_analysis_report(request: Request, execution_id: int) -> Response:
             return Response({"error": "No report file found for this execution."}, status=status.HTTP_404_NOT_FOUND)
 
         # Read report content
-        report_path = Path(settings.MEDIA_ROOT) / analysis.report_file_path
-        if not report_path.exists():
+        report_path = _resolve_media_path(analysis.report_file_path)
+        if report_path is None or not report_path.exists():
             return Response({"error": "Report file not found on disk."}, status=status.HTTP_404_NOT_FOUND)
 
-        with report_path.open("r", encoding="utf-8") as f:
-            report_content = f.read()
-
-        return Response(
-            {
-                "report_content": report_content,
-                "execution_name": execution.execution_name,
-                "project_name": execution.project.name,
-            }
-        )
+        return _serve_report(request, report_path, execution)
 
     except (OSError, PermissionError, FileNotFoundError) as e:
         logger.error(f"Error reading report file for execution {execution_id}: {e}")
@@ -525,17 +653,63 @@ def get_tracer_analysis_report(request: Request, execution_id: int) -> Response:
         )
 
 
+def _file_etag(file_path: Path, *parts: object) -> str:
+    """Build a weak ETag from the file's mtime and size plus any extra response data."""
+    file_stat = file_path.stat()
+    token = "|".join(map(str, (file_stat.st_mtime_ns, file_stat.st_size, *parts)))
+    return f'W/"{hashlib.sha256(token.encode()).hexdigest()[:32]}"'
+
+
+def _serve_with_etag(
+    request: Request, file_path: Path, build_response: Callable[[], HttpResponseBase], *etag_parts: object
+) -> HttpResponseBase:
+    """Answer with 304 when the client already has this file, otherwise tag the built response."""
+    etag = _file_etag(file_path, *etag_parts)
+    if_none_match = parse_etags(request.headers.get("if-none-match", ""))
+    # "*" matches any current representation, as in django.utils.cache
+    if if_none_match == ["*"] or etag in if_none_match:
+        not_modified = HttpResponseNotModified()
+        not_modified["ETag"] = etag
+        return not_modified
+    response = build_response()
+    if response.status_code == status.HTTP_200_OK:
+        response["ETag"] = etag
+    return response
+
+
+def _serve_report(request: Request, report_path: Path, execution: ProfileExecution) -> HttpResponseBase:
+    if _wants_raw_file(request):
+        return _serve_with_etag(
+            request, report_path, lambda: _serve_raw_file(report_path, "text/markdown; charset=utf-8"), "raw"
+        )
+
+    return _serve_with_etag(
+        request,
+        report_path,
+        lambda: Response(
+            {
+                "report_content": report_path.read_text(encoding="utf-8"),
+                "execution_name": execution.execution_name,
+                "project_name": execution.project.name,
+            }
+        ),
+        execution.execution_name,
+        execution.project.name,
+    )
+
+
 @api_view(["GET"])
-def get_tracer_workflow_graph(request: Request, execution_id: int) -> Response | FileResponse:
+def get_tracer_workflow_graph(request: Request, execution_id: int) -> HttpResponseBase:
     """Get the workflow graph content for a TRACER execution.
 
     If 'graph_format' query parameter is provided, it serves the file for download.
-    Otherwise, it returns JSON with SVG content for inline display.
+    Otherwise, it returns JSON with SVG content for inline display, or streams the SVG
+    itself when ``?raw=1`` is given.
     """
     try:
         # Validate access
         error_response, execution = TracerExecutionAccessValidator.validate_tracer_execution_access(
-            request, execution_id
+            request, execution_id, TracerExecutionAccessValidator.GRAPH_FIELDS
         )
         if error_response:
             return error_response
@@ -562,16 +736,18 @@ def get_tracer_workflow_graph(request: Request, execution_id: int) -> Response |
 
 def _handle_graph_request(
     request: Request, execution: ProfileExecution, analysis: TracerAnalysisResult
-) -> Response | FileResponse:
+) -> HttpResponseBase:
     """Handle graph request logic for different formats and download modes."""
-    requested_format = _get_requested_graph_format(request, analysis)
+    # Computed once and shared by the helpers below
+    available_formats = analysis.get_available_formats()
+    requested_format = _get_requested_graph_format(request, available_formats)
     if requested_format is None:
         return Response({"error": "No graph formats available."}, status=status.HTTP_404_NOT_FOUND)
 
     is_download = bool(request.GET.get("graph_format", "") or request.GET.get("format", ""))
-    available_formats = analysis.get_available_formats()
 
-    if is_download and requested_format not in available_formats:
+    # Unknown formats are rejected before any field lookup
+    if requested_format not in _GRAPH_PATH_FIELDS or (is_download and requested_format not in available_formats):
         return Response(
             {"error": f"Format '{requested_format}' not available for this execution."},
             status=status.HTTP_404_NOT_FOUND,
@@ -584,11 +760,12 @@ def _handle_graph_request(
             status=status.HTTP_404_NOT_FOUND,
         )
 
-    if is_download:
-        return _serve_graph_file_for_download(graph_path, execution, requested_format)
+    # Raw requests get the file streamed inline instead of as an attachment
+    if is_download or _wants_raw_file(request):
+        return _serve_graph_file_for_download(graph_path, execution, requested_format, as_attachment=is_download)
 
     if requested_format == "svg":
-        return _serve_inline_svg(graph_path, execution, requested_format, analysis)
+        return _serve_inline_svg(request, graph_path, execution, available_formats)
 
     return Response(
         {"error": f"Unsupported request for format: {requested_format}"},
@@ -596,11 +773,18 @@ def _handle_graph_request(
     )
 
 
-def _get_requested_graph_format(request: Request, analysis: TracerAnalysisResult) -> str | None:
+# Supported graph formats mapped to the analysis field holding their path
+_GRAPH_PATH_FIELDS = {
+    "svg": operator.attrgetter("workflow_graph_svg_path"),
+    "png": operator.attrgetter("workflow_graph_png_path"),
+    "pdf": operator.attrgetter("workflow_graph_pdf_path"),
+}
+
+
+def _get_requested_graph_format(request: Request, available_formats: list[str]) -> str | None:
     requested_format = request.GET.get("graph_format", "").lower()
     if not requested_format:
         requested_format = request.GET.get("format", "").lower()
-    available_formats = analysis.get_available_formats()
     if not requested_format:
         if "svg" in available_formats:
             return "svg"
@@ -609,22 +793,24 @@ def _get_requested_graph_format(request: Request, analysis: TracerAnalysisResult
 
 
 def _get_graph_path(analysis: TracerAnalysisResult, requested_format: str) -> Path | None:
-    graph_path_field = f"workflow_graph_{requested_format}_path"
-    graph_path_str = getattr(analysis, graph_path_field, "")
+    getter = _GRAPH_PATH_FIELDS.get(requested_format)
+    if getter is None:
+        return None
+    graph_path_str = getter(analysis)
     if not graph_path_str:
         return None
-    return Path(settings.MEDIA_ROOT) / graph_path_str
+    return _resolve_media_path(graph_path_str)
 
 
 def _serve_graph_file_for_download(
-    graph_path: Path, execution: ProfileExecution, requested_format: str
+    graph_path: Path, execution: ProfileExecution, requested_format: str, *, as_attachment: bool = True
 ) -> FileResponse | Response:
     if not graph_path.exists():
         return Response({"error": "Workflow graph file not found on disk."}, status=status.HTTP_404_NOT_FOUND)
     try:
         return FileResponse(
             graph_path.open("rb"),
-            as_attachment=True,
+            as_attachment=as_attachment,
             filename=f"{execution.execution_name}_workflow_graph.{requested_format}",
         )
     except FileNotFoundError:
@@ -632,20 +818,25 @@ def _serve_graph_file_for_download(
 
 
 def _serve_inline_svg(
-    graph_path: Path, execution: ProfileExecution, requested_format: str, analysis: TracerAnalysisResult
-) -> Response:
+    request: Request, graph_path: Path, execution: ProfileExecution, available_formats: list[str]
+) -> HttpResponseBase:
     if not graph_path.exists():
         return Response({"error": "Workflow graph file not found on disk."}, status=status.HTTP_404_NOT_FOUND)
-    with graph_path.open("r", encoding="utf-8") as f:
-        graph_content = f.read()
-    return Response(
-        {
-            "file_type": "svg",
-            "graph_content": graph_content,
-            "execution_name": execution.execution_name,
-            "project_name": execution.project.name,
-            "available_formats": analysis.get_available_formats(),
-        }
+    return _serve_with_etag(
+        request,
+        graph_path,
+        lambda: Response(
+            {
+                "file_type": "svg",
+                "graph_content": graph_path.read_text(encoding="utf-8"),
+                "execution_name": execution.execution_name,
+                "project_name": execution.project.name,
+                "available_formats": available_formats,
+            }
+        ),
+        execution.execution_name,
+        execution.project.name,
+        *available_formats,
     )
 
 
@@ -655,7 +846,7 @@ def get_tracer_original_profiles(request: Request, execution_id: int) -> Respons
     try:
         # Validate access
         error_response, execution = TracerExecutionAccessValidator.validate_tracer_execution_access(
-            request, execution_id
+            request, execution_id, ()
         )
         if error_response:
             return error_response
@@ -696,7 +887,7 @@ def get_tracer_execution_logs(request: Request, execution_id: int) -> Response:
     try:
         # Validate access
         error_response, execution = TracerExecutionAccessValidator.validate_tracer_execution_access(
-            request, execution_id
+            request, execution_id, TracerExecutionAccessValidator.LOG_FIELDS
         )
         if error_response:
             return error_response
@@ -46,6 +46,9 @@ class EmailAuthBackend:
             if user.check_password(password) and self.user_can_authenticate(user):
                 return user
         except CustomUser.DoesNotExist:
+            # Run the password hasher once anyway so unknown emails take as long as wrong
+            # passwords and cannot be told apart by timing (mirrors Django's ModelBackend)
+            CustomUser().set_password(password)
             return None
 
         return None
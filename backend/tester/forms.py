@@ -1,6 +1,7 @@
 """Forms for the tester app."""
 
 import logging
+from functools import partial
 from typing import Any, ClassVar
 
 from django import forms
@@ -30,12 +31,12 @@ class MultipleFileField(forms.FileField):
         It processes a list of uploaded files and cleans each one individually.
         """
         logger.debug("MultipleFileField.clean called with data=%s, initial=%s", data, initial)
-        single_file_clean = super().clean
+        single_file_clean = partial(super().clean, initial=initial)
         if isinstance(data, list | tuple):
-            result = [single_file_clean(d, initial) for d in data]
-        else:
-            result = single_file_clean(data, initial)
-        return result
+            if not data:
+                return []
+            return list(map(single_file_clean, data))
+        return single_file_clean(data)
 
 
 class TestCaseForm(forms.ModelForm):
@@ -4,6 +4,7 @@ import os
 
 from django.contrib.auth import get_user_model
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from django.db.utils import IntegrityError
 
 
@@ -36,20 +37,29 @@ class Command(BaseCommand):
             )
             return
 
-        # Check if superuser already exists
+        # Check if superuser already exists. This is the common path on every restart, and checking
+        # first avoids hashing the password just to have the INSERT rejected.
         if user_model.objects.filter(email=email).exists():
             self.stdout.write(self.style.SUCCESS(f"Superuser with email {email} already exists"))
             return
 
         # Create superuser
         try:
-            user_model.objects.create_superuser(
-                email=email,
-                password=password,
-                username="",
-                first_name=first_name,
-                last_name=last_name,
-            )
-            self.stdout.write(self.style.SUCCESS(f"Successfully created superuser: {email}"))
-        except (IntegrityError, ValueError) as exc:
+            with transaction.atomic():
+                user_model.objects.create_superuser(
+                    email=email,
+                    password=password,
+                    username="",
+                    first_name=first_name,
+                    last_name=last_name,
+                )
+        except IntegrityError as exc:
+            # Another container booting in parallel may have created it since the check above
+            if user_model.objects.filter(email=email).exists():
+                self.stdout.write(self.style.SUCCESS(f"Superuser with email {email} already exists"))
+            else:
+                self.stdout.write(self.style.ERROR(f"Error creating superuser: {exc!s}"))
+        except ValueError as exc:
             self.stdout.write(self.style.ERROR(f"Error creating superuser: {exc!s}"))
+        else:
+            self.stdout.write(self.style.SUCCESS(f"Successfully created superuser: {email}"))
@@ -0,0 +1,16 @@
+"""Index the ongoing profile generation task lookup."""
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tester", "0020_tracer_cancellation"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="profilegenerationtask",
+            index=models.Index(fields=["project", "status", "-created_at"], name="tester_gentask_proj_status_idx"),
+        ),
+    ]
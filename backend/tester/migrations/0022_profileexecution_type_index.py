@@ -0,0 +1,16 @@
+"""Index profile executions by type and creation date."""
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tester", "0021_profilegenerationtask_ongoing_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="profileexecution",
+            index=models.Index(fields=["execution_type", "-created_at"], name="tester_exec_type_created_idx"),
+        ),
+    ]
@@ -0,0 +1,24 @@
+"""Index the test file and per-project execution lookups."""
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tester", "0022_profileexecution_type_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="profileexecution",
+            index=models.Index(fields=["project", "execution_type"], name="tester_exec_proj_type_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="testfile",
+            index=models.Index(fields=["execution", "project"], name="tester_testfile_exec_proj_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="testfile",
+            index=models.Index(fields=["project", "is_valid"], name="tester_testfile_proj_valid_idx"),
+        ),
+    ]
@@ -4,6 +4,7 @@ import logging
 import os
 import re
 import shutil
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, ClassVar
 
@@ -13,11 +14,20 @@ from django.conf import settings
 from django.contrib.auth.base_user import BaseUserManager
 from django.contrib.auth.models import AbstractUser
 from django.db import models, transaction
+from django.db.models.functions import Greatest
 from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 
 from .senpai_validation import validate_yaml_content
 
+# Prefer the libyaml-backed loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as YamlSafeDumper
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeDumper as YamlSafeDumper
+    from yaml import SafeLoader as YamlSafeLoader
+
 # Configure logger
 logger = logging.getLogger(__name__)
 
@@ -38,6 +48,19 @@ if not FERNET_KEY:
 # Create cipher suite
 cipher_suite = Fernet(FERNET_KEY)
 
+# Distinct decrypted API keys kept in memory per process
+API_KEY_DECRYPT_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=API_KEY_DECRYPT_CACHE_SIZE)
+def decrypt_api_key(api_key_encrypted: str) -> str:
+    """Decrypt a stored API key token.
+
+    Fernet tokens embed a random IV, so a token is never reused for a different key and
+    caching by token needs no invalidation when a key is replaced.
+    """
+    return cipher_suite.decrypt(api_key_encrypted.encode()).decode()
+
 
 class UserAPIKey(models.Model):
     """Model to store the API keys for the users.
@@ -60,16 +83,24 @@ class UserAPIKey(models.Model):
         """Return a string representation of the UserAPIKey."""
         return f"{self.name} ({self.get_provider_display()})"
 
-    def set_api_key(self, api_key: str) -> None:
-        """Encrypt and store the provided API key."""
+    def set_api_key(self, api_key: str, *, save: bool = True) -> None:
+        """Encrypt and store the provided API key.
+
+        Pass ``save=False`` to only set the field when the caller saves the instance afterwards.
+        """
         encrypted_key = cipher_suite.encrypt(api_key.encode())
         self.api_key_encrypted = encrypted_key.decode()
-        self.save()
+        if not save:
+            return
+        if self._state.adding:
+            self.save()
+        else:
+            self.save(update_fields=["api_key_encrypted"])
 
     def get_api_key(self) -> str | None:
         """Decrypt and return the stored API key."""
         if self.api_key_encrypted:
-            return cipher_suite.decrypt(self.api_key_encrypted.encode()).decode()
+            return decrypt_api_key(self.api_key_encrypted)
         return None
 
 
@@ -223,8 +254,19 @@ def resolve_unique_project_relative_path(
     reserved_paths: set[Path] | None = None,
 ) -> tuple[str, Path]:
     """Return a project-relative path that does not collide with an existing file."""
+    directory_path = get_project_relative_path(user_id, project_id, directory)
+    return resolve_unique_relative_path(directory_path, filename, reserved_paths=reserved_paths)
+
+
+def resolve_unique_relative_path(
+    directory_path: Path,
+    filename: str,
+    *,
+    reserved_paths: set[Path] | None = None,
+) -> tuple[str, Path]:
+    """Return a path in an already resolved MEDIA_ROOT-relative directory that does not collide with a file."""
     reserved_paths = reserved_paths or set()
-    relative_path = get_project_relative_path(user_id, project_id, directory, filename)
+    relative_path = directory_path / filename
     full_path = Path(settings.MEDIA_ROOT) / relative_path
     if full_path not in reserved_paths and not full_path.exists():
         return relative_path.as_posix(), full_path
@@ -233,8 +275,7 @@ def resolve_unique_project_relative_path(
     suffix = Path(filename).suffix
     counter = 1
     while True:
-        candidate_filename = f"{base_name}_{counter}{suffix}"
-        candidate_relative_path = get_project_relative_path(user_id, project_id, directory, candidate_filename)
+        candidate_relative_path = directory_path / f"{base_name}_{counter}{suffix}"
         candidate_full_path = Path(settings.MEDIA_ROOT) / candidate_relative_path
         if candidate_full_path not in reserved_paths and not candidate_full_path.exists():
             return candidate_relative_path.as_posix(), candidate_full_path
@@ -266,42 +307,32 @@ def is_relative_to_path(path: Path, parent: Path) -> bool:
 
 def upload_to(instance: "TestFile", filename: str) -> str:
     """Returns the path where the Test Files are stored."""
-    user_id = instance.project.owner.id
-    project_id = instance.project.id
-    return get_project_relative_path_str(user_id, project_id, "profiles", filename)
+    return instance.project.get_relative_project_path("profiles", filename).as_posix()
 
 
 def upload_to_personalities(instance: "PersonalityFile", filename: str) -> str:
     """Returns the path where the Personality files are stored."""
-    user_id = instance.project.owner.id
-    project_id = instance.project.id
-    return get_project_relative_path_str(user_id, project_id, "personalities", filename)
+    return instance.project.get_relative_project_path("personalities", filename).as_posix()
 
 
 def upload_to_rules(instance: "RuleFile", filename: str) -> str:
     """Returns the path where the Rules files are stored."""
-    user_id = instance.project.owner.id
-    project_id = instance.project.id
-    return get_project_relative_path_str(user_id, project_id, "rules", filename)
+    return instance.project.get_relative_project_path("rules", filename).as_posix()
 
 
 def upload_to_types(instance: "TypeFile", filename: str) -> str:
     """Returns the path where the Types files are stored."""
-    user_id = instance.project.owner.id
-    project_id = instance.project.id
-    return get_project_relative_path_str(user_id, project_id, "types", filename)
+    return instance.project.get_relative_project_path("types", filename).as_posix()
 
 
 def upload_to_sensei_check_rules(instance: "SenseiCheckRule", filename: str) -> str:
     """Returns the path where the SENSEI Check Rules files are stored."""
-    user_id = instance.project.owner.id
-    project_id = instance.project.id
-    return get_project_relative_path_str(user_id, project_id, "rules", filename)
+    return instance.project.get_relative_project_path("rules", filename).as_posix()
 
 
 def upload_to_custom_connectors(instance: "ChatbotConnector", filename: str) -> str:
     """Returns the path where custom connector YAML files are stored."""
-    user_id = instance.owner.id
+    user_id = instance.owner_id
     return f"users/user_{user_id}/connectors/{filename}"
 
 
@@ -455,6 +486,14 @@ class TestFile(models.Model):
         "ProfileExecution", on_delete=models.CASCADE, null=True, blank=True, related_name="test_files"
     )
 
+    class Meta:
+        """Meta options for the TestFile model."""
+
+        indexes: ClassVar[list[models.Index]] = [
+            models.Index(fields=["execution", "project"], name="tester_testfile_exec_proj_idx"),
+            models.Index(fields=["project", "is_valid"], name="tester_testfile_proj_valid_idx"),
+        ]
+
     def __str__(self) -> str:
         """Return the base name of the file."""
         return Path(self.file.name).name
@@ -462,94 +501,193 @@ class TestFile(models.Model):
     def save(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
         """Save the TestFile instance."""
         update_execution_profile_count = kwargs.pop("update_execution_profile_count", True)
+        adding = self._state.adding
+
+        # Callers naming the changed columns (e.g. path rewrites after a project rename) already know
+        # the profile content is unchanged, so skip re-reading and re-canonicalizing it
+        if not adding and kwargs.get("update_fields") is not None:
+            super().save(*args, **kwargs)
+            return
 
         # If no execution is assigned and this is a new file, create/assign a manual execution
-        if not self.execution and not self.pk:
+        if self.execution_id is None and not self.pk:
             self.execution = self.project.get_or_create_current_manual_execution()
 
-        super().save(*args, **kwargs)
-
-        # After saving, try to read and process the file
-        if self.file and hasattr(self.file, "path") and Path(self.file.path).exists():
+        # Uploads that are not stored yet are canonicalized from the upload buffer and written straight
+        # to their final path; stored profiles are re-validated and moved before the row is written.
+        # Either way the single INSERT/UPDATE below already stores the final file, name and validity
+        if self.file and not self.file._committed:  # noqa: SLF001
             try:
-                # First read the file for validation
-                with Path(self.file.path).open() as file:
-                    yaml_content = file.read()
-
-                # Validate using the same Senpai validator package used by the assistant.
-                validation = validate_yaml_content(yaml_content, kind="profile")
-
-                # Parse the YAML content for further processing
-                data = yaml.safe_load(yaml_content)
-                yaml_test_name = data.get("test_name") if isinstance(data, dict) else None
-                effective_name = self.name or yaml_test_name
-
-                if not effective_name:
-                    self.is_valid = False
-                    TestFile.objects.filter(pk=self.pk).update(is_valid=False)
-                    return
-
-                # Keep the canonical editable profile under project/profiles for Senpai discovery.
-                user_id = self.project.owner.id
-                project_id = self.project.id
-                profile_name = sanitize_profile_name_for_filename(effective_name)
-                if not profile_name:
-                    self.is_valid = False
-                    TestFile.objects.filter(pk=self.pk).update(is_valid=False)
-                    return
-
-                # Create new filename and change the extension to yaml
-                new_filename = f"{profile_name}.yaml"
-                new_path = get_project_relative_path_str(user_id, project_id, "profiles", new_filename)
-
-                # Rename the file
-                old_path = self.file.path
-                new_full_path = Path(settings.MEDIA_ROOT) / new_path
-                profiles_root = Path(settings.MEDIA_ROOT) / get_project_relative_path(user_id, project_id, "profiles")
-                if not is_relative_to_path(new_full_path, profiles_root):
-                    self.is_valid = False
-                    TestFile.objects.filter(pk=self.pk).update(is_valid=False)
-                    return
-
-                # Create parent directories if they don't exist
-                new_full_path.parent.mkdir(parents=True, exist_ok=True)
-                old_full_path = Path(old_path)
-                if old_full_path != new_full_path:
-                    new_path, new_full_path = resolve_unique_project_relative_path(
-                        user_id,
-                        project_id,
-                        "profiles",
-                        new_filename,
-                        reserved_paths={old_full_path},
-                    )
-                    new_full_path.parent.mkdir(parents=True, exist_ok=True)
-                    old_full_path.rename(new_full_path)
-
-                # Update the model
-                self.file.name = new_path
-                self.name = Path(new_path).stem
-
-                # Set validation status - only boolean flag
-                self.is_valid = validation.is_valid
-
-                # Update execution profile count
-                if self.execution and update_execution_profile_count:
-                    profile_count = self.execution.test_files.count()
-                    self.execution.generated_profiles_count = profile_count
-                    self.execution.save(update_fields=["generated_profiles_count"])
-
-                # Save again with updated fields
-                TestFile.objects.filter(pk=self.pk).update(file=self.file.name, name=self.name, is_valid=self.is_valid)
-
+                self._store_uploaded_profile()
+            except yaml.YAMLError as e:
+                logger.warning("Error processing uploaded TestFile %s: %s", self.file.name, e)
+                self.is_valid = False
+        elif self.file and hasattr(self.file, "path") and Path(self.file.path).exists():
+            try:
+                self.canonicalize_profile_file()
             except (FileNotFoundError, yaml.YAMLError) as e:
                 logger.warning("Error processing TestFile %s: %s", self.pk, e)
                 self.is_valid = False
-                TestFile.objects.filter(pk=self.pk).update(is_valid=False)
+
+        super().save(*args, **kwargs)
+
+        # Count every new row on its execution, matching the uncount when it is deleted
+        if adding and update_execution_profile_count:
+            self._increment_execution_profile_count()
+
+    def _increment_execution_profile_count(self) -> None:
+        """Count this new profile on its execution with a single atomic UPDATE."""
+        if self.execution_id:
+            ProfileExecution.objects.filter(pk=self.execution_id).update(
+                generated_profiles_count=models.F("generated_profiles_count") + 1
+            )
+
+    def canonicalize_profile_file(self, profiles_rel_dir: Path | None = None, yaml_content: str | None = None) -> bool:
+        """Validate the profile YAML and rename it after its test name under project/profiles.
+
+        Only ``file``, ``name`` and ``is_valid`` are updated in memory; persisting them is up
+        to the caller, which lets unsaved instances be prepared for ``bulk_create``. Callers
+        handling many profiles of one project can pass its resolved ``profiles_rel_dir``, and
+        callers that just wrote the file can pass its ``yaml_content`` to skip reading it back.
+
+        Returns:
+            False if the profile has no usable name and was left in place, True otherwise.
+        """
+        # First read the file for validation, unless the caller already has its content
+        if yaml_content is None:
+            with Path(self.file.path).open() as file:
+                yaml_content = file.read()
+
+        old_full_path = Path(self.file.path)
+        target = self._resolve_canonical_profile_path(yaml_content, profiles_rel_dir, old_full_path)
+        if target is None:
+            return False
+
+        new_path, new_full_path = target
+        if old_full_path != new_full_path:
+            old_full_path.rename(new_full_path)
+
+        # Update the model
+        self.file.name = new_path
+        self.name = Path(new_path).stem
+        return True
+
+    def _store_uploaded_profile(self) -> bool:
+        """Canonicalize a not yet stored upload and write it directly to its final path.
+
+        Returns:
+            False if the profile has no usable name; the upload is then left for the regular
+            ``upload_to`` storage path.
+        """
+        upload = self.file.file
+        upload.seek(0)
+        content = upload.read()
+        upload.seek(0)
+        yaml_content = content.decode("utf-8") if isinstance(content, bytes) else content
+
+        target = self._resolve_canonical_profile_path(yaml_content)
+        if target is None:
+            return False
+
+        stored_path = self.file.storage.save(target[0], upload, max_length=self.file.field.max_length)
+        self.file = stored_path
+        self.name = Path(stored_path).stem
+        return True
+
+    def _resolve_canonical_profile_path(
+        self, yaml_content: str, profiles_rel_dir: Path | None = None, current_full_path: Path | None = None
+    ) -> tuple[str, Path] | None:
+        """Validate the profile YAML and pick its canonical path under project/profiles.
+
+        Sets ``is_valid`` and creates the target directory. ``current_full_path`` is where the
+        profile already lives, if anywhere; keeping that path is not treated as a collision.
+
+        Returns:
+            The MEDIA_ROOT-relative and absolute target paths, or None if the profile has no usable name.
+        """
+        # Validate using the same Senpai validator package used by the assistant.
+        validation = validate_yaml_content(yaml_content, kind="profile")
+
+        # Parse the YAML content for further processing
+        data = yaml.load(yaml_content, Loader=YamlSafeLoader)
+        yaml_test_name = data.get("test_name") if isinstance(data, dict) else None
+        effective_name = self.name or yaml_test_name
+
+        if not effective_name:
+            self.is_valid = False
+            return None
+
+        # Keep the canonical editable profile under project/profiles for Senpai discovery.
+        if profiles_rel_dir is None:
+            profiles_rel_dir = self.project.get_relative_project_path("profiles")
+        profile_name = sanitize_profile_name_for_filename(effective_name)
+        if not profile_name:
+            self.is_valid = False
+            return None
+
+        # Create new filename and change the extension to yaml
+        new_filename = f"{profile_name}.yaml"
+        new_path = (profiles_rel_dir / new_filename).as_posix()
+
+        new_full_path = Path(settings.MEDIA_ROOT) / new_path
+        profiles_root = Path(settings.MEDIA_ROOT) / profiles_rel_dir
+        if not is_relative_to_path(new_full_path, profiles_root):
+            self.is_valid = False
+            return None
+
+        # Create parent directories if they don't exist
+        new_full_path.parent.mkdir(parents=True, exist_ok=True)
+        if current_full_path != new_full_path:
+            new_path, new_full_path = resolve_unique_relative_path(
+                profiles_rel_dir,
+                new_filename,
+                reserved_paths={current_full_path} if current_full_path is not None else None,
+            )
+            new_full_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Set validation status - only boolean flag
+        self.is_valid = validation.is_valid
+        return new_path, new_full_path
+
+
+@receiver(post_delete, sender=TestFile)
+def decrement_execution_profile_count(
+    sender: type[TestFile],
+    instance: TestFile,
+    origin: models.Model | models.QuerySet | None = None,
+    **_kwargs: Any,  # noqa: ANN401
+) -> None:
+    """Uncount a deleted profile on its execution without recounting the execution's files."""
+    # Cascades from a deleted execution or project remove the counter along with its owner
+    deleted_directly = isinstance(origin, TestFile) or (
+        isinstance(origin, models.QuerySet) and origin.model is TestFile
+    )
+    if not deleted_directly or not instance.execution_id:
+        return
+    ProfileExecution.objects.filter(pk=instance.execution_id).update(
+        generated_profiles_count=Greatest(models.F("generated_profiles_count") - 1, 0)
+    )
+
+
+def deleted_with_project(origin: models.Model | models.QuerySet | None) -> bool:
+    """Return whether a post_delete signal comes from deleting whole projects.
+
+    Project files live inside the project directory, which is removed as a whole once the
+    deletion commits, so they do not need to be unlinked one by one.
+    """
+    return isinstance(origin, Project) or (isinstance(origin, models.QuerySet) and origin.model is Project)
 
 
 @receiver(post_delete, sender=TestFile)
-def delete_file_from_media(sender: type[TestFile], instance: TestFile, **_kwargs: Any) -> None:  # noqa: ANN401
+def delete_file_from_media(
+    sender: type[TestFile],
+    instance: TestFile,
+    origin: models.Model | models.QuerySet | None = None,
+    **_kwargs: Any,  # noqa: ANN401
+) -> None:
     """Delete the file from media when the TestFile is deleted."""
+    if deleted_with_project(origin):
+        return
     try:
         if instance.file and Path(instance.file.path).exists():
             Path(instance.file.path).unlink()
@@ -637,7 +775,7 @@ class Project(models.Model):
 
     def get_relative_project_path(self, *parts: str) -> Path:
         """Return the relative path to this project's directory or descendants."""
-        return get_project_relative_path(self.owner.id, self.id, *parts)
+        return get_project_relative_path_for_folder(self.owner_id, self.get_project_folder_name(), *parts)
 
     def get_project_path(self) -> str:
         """Get the full filesystem path to the project folder."""
@@ -682,7 +820,7 @@ class Project(models.Model):
 
         try:
             with Path(run_yml_path).open("w") as f:
-                yaml.dump(config_data, f, default_flow_style=False, allow_unicode=True)
+                yaml.dump(config_data, f, Dumper=YamlSafeDumper, default_flow_style=False, allow_unicode=True)
             logger.info("Updated run.yml at %s", run_yml_path)
         except yaml.YAMLError:
             logger.exception("Error creating run.yml")
@@ -693,9 +831,7 @@ class Project(models.Model):
         execution_name = "Manual_Profiles"
 
         # Create directory structure
-        user_id = self.owner.id
-        project_id = self.id
-        execution_dir = get_project_relative_path_str(user_id, project_id, "executions", "manual_profiles")
+        execution_dir = self.get_relative_project_path("executions", "manual_profiles").as_posix()
 
         # Create execution record
         return ProfileExecution.objects.create(
@@ -717,16 +853,24 @@ class Project(models.Model):
         return self.create_manual_execution_folder()
 
 
+def schedule_directory_removal(path: Path) -> None:
+    """Remove a directory tree in a Celery worker once the current transaction commits."""
+
+    def dispatch() -> None:
+        # tester.api.tasks imports this module, so resolve the helper when it is needed
+        from .api.tasks import remove_directory_in_background  # noqa: PLC0415
+
+        remove_directory_in_background(path)
+
+    transaction.on_commit(dispatch)
+
+
 @receiver(post_delete, sender=Project)
 def delete_project_directory(sender: type[Project], instance: Project, **_kwargs: Any) -> None:  # noqa: ANN401
     """Delete the entire project directory when the Project is deleted."""
-    project_path = instance.get_project_path()
-    if Path(project_path).exists():
-        try:
-            shutil.rmtree(project_path)
-            logger.info("Deleted project directory: %s", project_path)
-        except OSError:
-            logger.exception("Error deleting project directory %s", project_path)
+    # The row is already gone, so resolve the folder from the instance rather than the database
+    relative_path = get_project_relative_path_for_folder(instance.owner_id, instance.get_project_folder_name())
+    schedule_directory_removal(Path(settings.MEDIA_ROOT) / relative_path)
 
 
 class ChatbotConnector(models.Model):
@@ -836,13 +980,13 @@ def delete_test_case_directories(sender: type[TestCase], instance: TestCase, **_
     """Delete the test case directories when the TestCase is deleted."""
     try:
         # Get the user and project IDs
-        user_id = instance.project.owner.id
-        project_id = instance.project.id
+        user_id = instance.project.owner_id
+        project_id = instance.project_id
         test_case_id = instance.id
 
         # Path to the profiles directory for this test case
-        profiles_path = Path(settings.MEDIA_ROOT) / get_project_relative_path(
-            user_id, project_id, "profiles", f"testcase_{test_case_id}"
+        profiles_path = Path(settings.MEDIA_ROOT) / instance.project.get_relative_project_path(
+            "profiles", f"testcase_{test_case_id}"
         )
 
         # Path to the results directory for this test case
@@ -854,21 +998,9 @@ def delete_test_case_directories(sender: type[TestCase], instance: TestCase, **_
             / f"testcase_{test_case_id}"
         )
 
-        # Delete profiles directory if it exists
-        if profiles_path.exists():
-            try:
-                shutil.rmtree(profiles_path)
-                logger.info("Deleted test case profiles directory: %s", profiles_path)
-            except OSError:
-                logger.exception("Error deleting test case profiles directory %s", profiles_path)
-
-        # Delete results directory if it exists
-        if results_path.exists():
-            try:
-                shutil.rmtree(results_path)
-                logger.info("Deleted test case results directory: %s", results_path)
-            except OSError:
-                logger.exception("Error deleting test case results directory %s", results_path)
+        # Delete the profiles and results directories in the background
+        schedule_directory_removal(profiles_path)
+        schedule_directory_removal(results_path)
 
     except Exception:
         logger.exception("Error in delete_test_case_directories signal")
@@ -1094,6 +1226,14 @@ class ProfileGenerationTask(models.Model):
     )
     celery_task_id = models.CharField(max_length=255, blank=True, help_text="Celery task ID for progress tracking")
 
+    class Meta:
+        """Meta options for the ProfileGenerationTask model."""
+
+        indexes: ClassVar[list[models.Index]] = [
+            # Serves the latest ongoing task lookup for a project
+            models.Index(fields=["project", "status", "-created_at"], name="tester_gentask_proj_status_idx"),
+        ]
+
     def __str__(self) -> str:
         """Return a string representation of the task."""
         return f"ProfileGenerationTask {self.id} for Project {self.project.name}"
@@ -1195,29 +1335,48 @@ class ProjectConfig(models.Model):
 def delete_personality_file_from_media(
     sender: type[PersonalityFile],
     instance: PersonalityFile,
+    origin: models.Model | models.QuerySet | None = None,
     **_kwargs: Any,  # noqa: ANN401
 ) -> None:
     """Delete the personality file from media when the PersonalityFile is deleted."""
-    instance.file.delete(save=False)
+    if not deleted_with_project(origin):
+        instance.file.delete(save=False)
 
 
 @receiver(post_delete, sender=RuleFile)
-def delete_rule_file_from_media(sender: type[RuleFile], instance: RuleFile, **_kwargs: Any) -> None:  # noqa: ANN401
+def delete_rule_file_from_media(
+    sender: type[RuleFile],
+    instance: RuleFile,
+    origin: models.Model | models.QuerySet | None = None,
+    **_kwargs: Any,  # noqa: ANN401
+) -> None:
     """Delete the rule file from media when the RuleFile is deleted."""
-    instance.file.delete(save=False)
+    if not deleted_with_project(origin):
+        instance.file.delete(save=False)
 
 
 @receiver(post_delete, sender=SenseiCheckRule)
 def delete_sensei_check_rule_file_from_media(
-    sender: type[SenseiCheckRule], instance: SenseiCheckRule, **_kwargs: object
+    sender: type[SenseiCheckRule],
+    instance: SenseiCheckRule,
+    origin: models.Model | models.QuerySet | None = None,
+    **_kwargs: object,
 ) -> None:
     """Delete the SENSEI Check rule file from media when the SenseiCheckRule is deleted."""
-    instance.file.delete(save=False)
+    if not deleted_with_project(origin):
+        instance.file.delete(save=False)
 
 
 @receiver(post_delete, sender=TypeFile)
-def delete_type_file_from_media(sender: type[TypeFile], instance: TypeFile, **_kwargs: Any) -> None:  # noqa: ANN401
+def delete_type_file_from_media(
+    sender: type[TypeFile],
+    instance: TypeFile,
+    origin: models.Model | models.QuerySet | None = None,
+    **_kwargs: Any,  # noqa: ANN401
+) -> None:
     """Delete the file from media when the TypeFile is deleted."""
+    if deleted_with_project(origin):
+        return
     try:
         if instance.file and Path(instance.file.path).exists():
             Path(instance.file.path).unlink()
@@ -1375,6 +1534,12 @@ class ProfileExecution(models.Model):
         """Meta options for the ProfileExecution model."""
 
         ordering: ClassVar[list[str]] = ["execution_type", "-created_at"]  # Manual first, then by date desc
+        indexes: ClassVar[list[models.Index]] = [
+            # Serves the execution_type filter of the TRACER list and the default ordering
+            models.Index(fields=["execution_type", "-created_at"], name="tester_exec_type_created_idx"),
+            # Serves the per-project manual execution lookup
+            models.Index(fields=["project", "execution_type"], name="tester_exec_proj_type_idx"),
+        ]
 
     def __str__(self) -> str:
         """Return a string representation of the ProfileExecution."""
@@ -368,13 +368,15 @@ class UserAPIKeySerializer(serializers.ModelSerializer):
         """Update an existing UserAPIKey."""
         # Get the plain text API key
         api_key_plain = validated_data.pop("api_key", None)
-        # Update the API key if it is provided
-        if api_key_plain is not None:
-            instance.set_api_key(api_key_plain)
+        update_fields = ["name", "provider"]
+        # Re-encrypt the API key only if a different one is provided
+        if api_key_plain is not None and api_key_plain != instance.get_api_key():
+            instance.set_api_key(api_key_plain, save=False)
+            update_fields.append("api_key_encrypted")
         # Update the name and provider
         instance.name = validated_data.get("name", instance.name)
         instance.provider = validated_data.get("provider", instance.provider)
-        instance.save()
+        instance.save(update_fields=update_fields)
         return instance
 
     def get_decrypted_api_key(self, obj: UserAPIKey) -> str:
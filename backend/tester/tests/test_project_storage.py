@@ -14,6 +14,7 @@ from rest_framework.exceptions import ValidationError
 from rest_framework.test import APIRequestFactory, force_authenticate
 
 from tester.api.projects import ProjectViewSet, validate_yaml
+from tester.api.tasks import PENDING_DELETE_SUFFIX
 from tester.api.test_files import TestFileViewSet
 from tester.api.tracer_parser import TracerResultsProcessor
 from tester.models import (
@@ -302,6 +303,26 @@ class ProjectStorageLayoutTests(TestCase):
         self.assertEqual(profile.file.name, expected_relative)  # noqa: PT009
         self.assertTrue((self.media_root / expected_relative).exists())  # noqa: PT009
 
+    def test_test_file_save_with_update_fields_skips_profile_reprocessing(self) -> None:
+        """Saves limited to specific columns should not re-read or rename the stored profile."""
+        project = Project.objects.create(name="Alpha", chatbot_connector=self.connector, owner=self.user)
+        execution = project.create_manual_execution_folder()
+        profile = TestFile(project=project, execution=execution)
+        profile.file.save("upload.yaml", ContentFile("test_name: Manual Profile\nmessages: []\n"), save=False)
+        profile.save()
+        stored_name = profile.file.name
+
+        Path(profile.file.path).write_text("test_name: Renamed Profile\nmessages: []\n")
+        profile.is_valid = False
+        with patch.object(TestFile, "canonicalize_profile_file") as canonicalize_mock:
+            profile.save(update_fields=["is_valid"])
+
+        canonicalize_mock.assert_not_called()
+        profile.refresh_from_db()
+        self.assertEqual(profile.file.name, stored_name)  # noqa: PT009
+        self.assertEqual(profile.name, "Manual Profile")  # noqa: PT009
+        self.assertFalse(profile.is_valid)  # noqa: PT009
+
     def test_test_file_save_rejects_profile_name_path_traversal(self) -> None:
         """Profile names containing dot path segments should not escape the project profiles directory."""
         project = Project.objects.create(name="Alpha", chatbot_connector=self.connector, owner=self.user)
@@ -368,6 +389,29 @@ class ProjectStorageLayoutTests(TestCase):
         self.assertEqual(generated.file.name, expected_relative)  # noqa: PT009
         self.assertTrue((self.media_root / expected_relative).exists())  # noqa: PT009
 
+    def test_tracer_results_do_not_read_back_the_editable_profile_copy(self) -> None:
+        """The editable copy should be validated from the content already read, not reopened."""
+        project = Project.objects.create(name="Alpha", chatbot_connector=self.connector, owner=self.user)
+        execution = project.profile_executions.create(
+            execution_name="TRACER_1",
+            execution_type="tracer",
+            status="SUCCESS",
+            profiles_directory=f"users/user_{self.user.id}/projects/{project.get_project_folder_name()}/tracer_results/tracer_1",
+        )
+        output_dir = self.media_root / execution.profiles_directory
+        profiles_dir = output_dir / "profiles"
+        profiles_dir.mkdir(parents=True, exist_ok=True)
+        (profiles_dir / "generated.yaml").write_text("test_name: Generated Profile\nmessages: []\n", encoding="utf-8")
+        editable_copy = Path(project.get_project_path()) / "profiles" / "generated.yaml"
+
+        with patch.object(Path, "open", autospec=True, side_effect=Path.open) as open_spy:
+            TracerResultsProcessor().process_tracer_results_dual_storage(execution, output_dir)
+
+        read_paths = {Path(call.args[0]) for call in open_spy.call_args_list if "r" in call.kwargs.get("mode", "r")}
+        self.assertNotIn(editable_copy, read_paths)  # noqa: PT009
+        generated = TestFile.objects.get(project=project, execution=execution)
+        self.assertEqual(generated.name, "Generated Profile")  # noqa: PT009
+
     def test_profile_save_avoids_overwriting_existing_canonical_profile(self) -> None:
         """Saving a second profile with the same test_name should suffix the canonical filename."""
         project = Project.objects.create(name="Alpha", chatbot_connector=self.connector, owner=self.user)
@@ -439,6 +483,29 @@ class ProjectStorageLayoutTests(TestCase):
         execution.refresh_from_db()
         self.assertEqual(execution.generated_profiles_count, 2)  # noqa: PT009
 
+    def test_unnamed_profile_upload_and_delete_keep_execution_count_in_sync(self) -> None:
+        """Profiles without a usable test name should still be counted on their execution."""
+        project = Project.objects.create(name="Alpha", chatbot_connector=self.connector, owner=self.user)
+        execution = project.create_manual_execution_folder()
+
+        test_file = TestFile(
+            project=project,
+            execution=execution,
+            file=SimpleUploadedFile("unnamed.yaml", b"user:\n  language: English\n"),
+        )
+        test_file.save()
+
+        execution.refresh_from_db()
+        self.assertFalse(test_file.is_valid)  # noqa: PT009
+        self.assertEqual(execution.generated_profiles_count, 1)  # noqa: PT009
+        self.assertEqual(execution.generated_profiles_count, execution.test_files.count())  # noqa: PT009
+
+        test_file.delete()
+
+        execution.refresh_from_db()
+        self.assertEqual(execution.generated_profiles_count, 0)  # noqa: PT009
+        self.assertEqual(execution.generated_profiles_count, execution.test_files.count())  # noqa: PT009
+
     def test_bulk_upload_preserves_conflict_resolved_name_from_processed_file_data(self) -> None:
         """Bulk uploads should keep the unique name chosen during conflict resolution."""
         project = Project.objects.create(name="Alpha", chatbot_connector=self.connector, owner=self.user)
@@ -678,3 +745,55 @@ class ProjectStorageLayoutTests(TestCase):
             self.user.id, connector_id, "Delete Before Commit Connector"
         )
         self.assertFalse(mirror_path.exists())  # noqa: PT009
+
+    def test_project_delete_moves_directory_aside_and_queues_removal(self) -> None:
+        """Deleting a project should hide its folder on commit and leave the removal to Celery."""
+        project = Project.objects.create(name="Alpha", chatbot_connector=self.connector, owner=self.user)
+        project_dir = Path(project.get_project_path())
+        (project_dir / "profiles").mkdir(parents=True)
+        (project_dir / "profiles" / "profile.yaml").write_text("test_name: Alpha\n")
+
+        with (
+            patch("tester.api.tasks.delete_directory_task.delay") as delay_mock,
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            project.delete()
+            self.assertTrue(project_dir.exists())  # noqa: PT009
+
+        self.assertFalse(project_dir.exists())  # noqa: PT009
+        delay_mock.assert_called_once()
+        pending_dir = Path(delay_mock.call_args.args[0])
+        self.assertEqual(pending_dir.parent, project_dir.parent)  # noqa: PT009
+        self.assertTrue(pending_dir.name.endswith(PENDING_DELETE_SUFFIX))  # noqa: PT009
+        self.assertTrue((pending_dir / "profiles" / "profile.yaml").exists())  # noqa: PT009
+
+    def test_project_delete_removes_directory_in_process_when_it_cannot_be_moved(self) -> None:
+        """A folder that cannot be renamed aside should still be removed once the delete commits."""
+        project = Project.objects.create(name="Alpha", chatbot_connector=self.connector, owner=self.user)
+        project_dir = Path(project.get_project_path())
+        (project_dir / "profiles").mkdir(parents=True)
+        (project_dir / "profiles" / "profile.yaml").write_text("test_name: Alpha\n")
+
+        with (
+            patch.object(Path, "rename", side_effect=PermissionError),
+            patch("tester.api.tasks.delete_directory_task.delay") as delay_mock,
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            project.delete()
+
+        self.assertFalse(project_dir.exists())  # noqa: PT009
+        delay_mock.assert_not_called()
+
+    def test_project_delete_leaves_profile_files_to_directory_removal(self) -> None:
+        """Cascaded file rows should not unlink their files one by one when the project is deleted."""
+        project = Project.objects.create(name="Alpha", chatbot_connector=self.connector, owner=self.user)
+        execution = project.create_manual_execution_folder()
+        profile = TestFile(project=project, execution=execution)
+        profile.file.save("upload.yaml", ContentFile("test_name: Manual Profile\nmessages: []\n"), save=False)
+        profile.save()
+        profile_path = Path(profile.file.path)
+
+        with patch("tester.api.tasks.delete_directory_task.delay"):
+            project.delete()
+
+        self.assertTrue(profile_path.exists())  # noqa: PT009
@@ -0,0 +1,104 @@
+"""Tests for reading TRACER subprocess output."""
+
+import subprocess
+import sys
+import time
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from tester.api.tracer_generator import TracerGenerator
+from tester.models import ChatbotConnector, CustomUser, ProfileExecution, ProfileGenerationTask, Project
+
+# Writes to both pipes in turn and splits "é" and "ñ" across two flushed writes
+INTERLEAVED_OUTPUT_SCRIPT = r"""
+import sys
+import time
+
+out, err = sys.stdout.buffer, sys.stderr.buffer
+out.write(b"Initializing Chatbot Exploration Agent\n"); out.flush()
+err.write(b"warning: slow model\n"); err.flush()
+out.write(b"caf\xc3"); out.flush()
+err.write(b"espa\xc3"); err.flush()
+time.sleep(0.2)
+out.write(b"\xa9 ready\n"); out.flush()
+err.write(b"\xb1ol\n"); err.flush()
+out.write(b"no trailing newline")
+"""
+
+# Reports progress once and then stays silent until it is terminated
+LONG_RUNNING_SCRIPT = r"""
+import sys
+import time
+
+print("=== Starting Exploration Session 1/3 ===", flush=True)
+time.sleep(30)
+print("should never be printed", flush=True)
+"""
+
+# Upper bound for a cancelled run; the child alone would take 30 seconds
+CANCELLED_RUN_MAX_SECONDS = 10
+
+
+class TracerProcessOutputTests(TestCase):
+    """Drive the TRACER output loop with real subprocesses."""
+
+    def setUp(self) -> None:
+        """Create the task and execution rows the output loop reads and updates."""
+        user = CustomUser.objects.create_user(email="owner@example.com")
+        connector = ChatbotConnector.objects.create(name="Primary Connector", technology="taskyto", owner=user)
+        project = Project.objects.create(name="Alpha", chatbot_connector=connector, owner=user)
+        self.execution = ProfileExecution.objects.create(
+            project=project,
+            execution_name="TRACER_1",
+            execution_type="tracer",
+            status="RUNNING",
+            profiles_directory="tracer_results/tracer_1",
+        )
+        self.task = ProfileGenerationTask.objects.create(project=project, execution=self.execution, status="RUNNING")
+        self.generator = TracerGenerator()
+
+    def start(self, script: str) -> subprocess.Popen:
+        """Start a Python child process running ``script`` with piped output."""
+        process = subprocess.Popen(  # noqa: S603
+            [sys.executable, "-c", script], stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        )
+        self.addCleanup(process.wait, timeout=5)
+        self.addCleanup(process.kill)
+        return process
+
+    def test_interleaved_output_is_captured_per_pipe(self) -> None:
+        """Both pipes should be read whole, with characters split across reads decoded intact."""
+        process = self.start(INTERLEAVED_OUTPUT_SCRIPT)
+
+        stdout_lines, stderr_text = self.generator._handle_process_output(  # noqa: SLF001
+            self.task, self.execution, process
+        )
+
+        expected_stdout = ["Initializing Chatbot Exploration Agent\n", "café ready\n", "no trailing newline"]
+        self.assertEqual(stdout_lines, expected_stdout)  # noqa: PT009
+        self.assertEqual(stderr_text, "warning: slow model\nespañol\n")  # noqa: PT009
+        self.assertEqual(process.wait(timeout=5), 0)  # noqa: PT009
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.stage, "Initializing Agent")  # noqa: PT009
+
+    def test_cancellation_mid_run_terminates_the_process_and_the_loop(self) -> None:
+        """Cancelling while TRACER runs should stop the child and return the output read so far."""
+        process = self.start(LONG_RUNNING_SCRIPT)
+        update_progress = self.generator._update_progress_from_tracer_output  # noqa: SLF001
+
+        def cancel_after_first_line(task: ProfileGenerationTask, line: str, celery_task: object = None) -> None:
+            update_progress(task, line, celery_task)
+            ProfileGenerationTask.objects.filter(pk=task.pk).update(status="CANCELLING")
+
+        started = time.monotonic()
+        with patch.object(self.generator, "_update_progress_from_tracer_output", side_effect=cancel_after_first_line):
+            stdout_lines, stderr_text = self.generator._handle_process_output(  # noqa: SLF001
+                self.task, self.execution, process
+            )
+
+        self.assertLess(time.monotonic() - started, CANCELLED_RUN_MAX_SECONDS)  # noqa: PT009
+        self.assertIsNotNone(process.poll())  # noqa: PT009
+        self.assertNotEqual(process.returncode, 0)  # noqa: PT009
+        self.assertEqual(stdout_lines, ["=== Starting Exploration Session 1/3 ===\n"])  # noqa: PT009
+        self.assertEqual(stderr_text, "")  # noqa: PT009
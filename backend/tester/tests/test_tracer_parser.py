@@ -0,0 +1,209 @@
+"""Tests for TRACER report metadata parsing."""
+
+import json
+import tempfile
+from pathlib import Path
+
+from django.test import SimpleTestCase
+
+from tester.api.tracer_parser import (
+    FORMAT_DETECTION_CHARS,
+    TXT_REPORT_MARKER,
+    TracerReportParser,
+    _parse_estimated_cost,
+)
+
+TXT_REPORT = """=== CHATBOT FUNCTIONALITY ANALYSIS ===
+
+## FUNCTIONALITIES (By Category)
+
+### CATEGORY: Ordering (3 functions)
+- place_order
+- modify_order
+- cancel_order
+
+### CATEGORY: Support (2 functions)
+- open_ticket
+- check_ticket
+
+=== TOTAL TOKEN CONSUMPTION ===
+Total LLM calls: 1,234
+Estimated cost: $0.1602 USD
+"""
+
+MD_REPORT = """# TRACER Report
+
+**6 functionalities** discovered across **3 categories**
+
+## Performance Statistics
+
+| Metric | Value |
+| --- | --- |
+| Total LLM Calls | 76 |
+| Estimated Cost | $0.0368 USD |
+
+## FUNCTIONALITIES (By Category)
+
+### CATEGORY: Ordering
+### CATEGORY: Support
+### CATEGORY: Billing
+"""
+
+MD_REPORT_WITHOUT_SUMMARY = """# TRACER Report
+
+## FUNCTIONALITIES (By Category)
+
+### CATEGORY: Ordering
+### CATEGORY: Support
+
+## Appendix
+
+### CATEGORY: Not a real category
+"""
+
+FUNCTIONALITIES_JSON = {
+    "functionalities": [{"name": "place_order"}, {"name": "modify_order"}, {"name": "open_ticket"}, {"name": "faq"}],
+    "statistics": {"total_calls": 50},
+}
+
+
+class TracerReportParserTests(SimpleTestCase):
+    """Check the metadata extracted from TRACER report files."""
+
+    def setUp(self) -> None:
+        """Create a temporary output directory for the report files."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.output_dir = Path(temp_dir.name)
+        self.parser = TracerReportParser()
+
+    def write_report(self, name: str, content: str) -> Path:
+        """Write a report file into the output directory and return its path."""
+        report_path = self.output_dir / name
+        report_path.write_text(content, encoding="utf-8")
+        return report_path
+
+    def write_functionalities_json(self) -> None:
+        """Write the sample functionalities.json next to the report."""
+        (self.output_dir / "functionalities.json").write_text(json.dumps(FUNCTIONALITIES_JSON), encoding="utf-8")
+
+    def test_txt_report_without_functionalities_json(self) -> None:
+        """The txt parser should count categories and functions and read the token totals."""
+        report_path = self.write_report("report.txt", TXT_REPORT)
+
+        metadata = self.parser.parse_report_metadata(report_path)
+
+        self.assertEqual(  # noqa: PT009
+            metadata,
+            {
+                "total_interactions": 0,
+                "unique_paths": 5,
+                "categories_count": 2,
+                "estimated_cost_usd": 0.1602,
+                "total_llm_calls": 1234,
+            },
+        )
+
+    def test_txt_report_with_functionalities_json(self) -> None:
+        """functionalities.json should supply the interactions while the report keeps its own counts."""
+        report_path = self.write_report("report.txt", TXT_REPORT)
+        self.write_functionalities_json()
+
+        metadata = self.parser.parse_report_metadata(report_path)
+
+        self.assertEqual(  # noqa: PT009
+            metadata,
+            {
+                "total_interactions": 50,
+                "unique_paths": 5,
+                "categories_count": 2,
+                "estimated_cost_usd": 0.1602,
+                "total_llm_calls": 1234,
+            },
+        )
+
+    def test_md_report_without_functionalities_json(self) -> None:
+        """The md parser should read the summary line and the performance table."""
+        report_path = self.write_report("README.md", MD_REPORT)
+
+        metadata = self.parser.parse_report_metadata(report_path)
+
+        self.assertEqual(  # noqa: PT009
+            metadata,
+            {
+                "total_interactions": 0,
+                "unique_paths": 6,
+                "categories_count": 3,
+                "estimated_cost_usd": 0.0368,
+                "total_llm_calls": 76,
+            },
+        )
+
+    def test_md_report_with_functionalities_json(self) -> None:
+        """functionalities.json should supply the interactions for md reports too."""
+        report_path = self.write_report("README.md", MD_REPORT)
+        self.write_functionalities_json()
+
+        metadata = self.parser.parse_report_metadata(report_path)
+
+        self.assertEqual(  # noqa: PT009
+            metadata,
+            {
+                "total_interactions": 50,
+                "unique_paths": 6,
+                "categories_count": 3,
+                "estimated_cost_usd": 0.0368,
+                "total_llm_calls": 76,
+            },
+        )
+
+    def test_md_category_section_ends_at_next_heading(self) -> None:
+        """Without a summary line, only categories inside the category section should be counted."""
+        report_path = self.write_report("README.md", MD_REPORT_WITHOUT_SUMMARY)
+        self.write_functionalities_json()
+
+        metadata = self.parser.parse_report_metadata(report_path)
+
+        self.assertEqual(metadata["categories_count"], 2)  # noqa: PT009
+        self.assertEqual(metadata["unique_paths"], 4)  # noqa: PT009
+        self.assertEqual(metadata["total_interactions"], 50)  # noqa: PT009
+
+    def test_txt_marker_straddling_the_detection_window_is_detected(self) -> None:
+        """A marker cut by the header read should still select the txt parser without dropping lines."""
+        first_category = "### CATEGORY: Early (1 functions)\n"
+        filler = "#" * (FORMAT_DETECTION_CHARS - len(first_category) - 10) + "\n"
+        content = first_category + filler + TXT_REPORT
+        marker_start = content.index(TXT_REPORT_MARKER)
+        self.assertLess(marker_start, FORMAT_DETECTION_CHARS)  # noqa: PT009
+        self.assertGreater(marker_start + len(TXT_REPORT_MARKER), FORMAT_DETECTION_CHARS)  # noqa: PT009
+        report_path = self.write_report("README.md", content)
+
+        metadata = self.parser.parse_report_metadata(report_path)
+
+        # "Total LLM calls:" lines are only understood by the txt parser
+        self.assertEqual(metadata["total_llm_calls"], 1234)  # noqa: PT009
+        self.assertEqual(metadata["categories_count"], 3)  # noqa: PT009
+        self.assertEqual(metadata["unique_paths"], 6)  # noqa: PT009
+        self.assertEqual(metadata["estimated_cost_usd"], 0.1602)  # noqa: PT009
+
+
+class EstimatedCostParsingTests(SimpleTestCase):
+    """Check the amounts accepted from "Estimated cost:" lines."""
+
+    def test_plain_amount_is_parsed(self) -> None:
+        """A dollar amount followed by USD should be returned as a float."""
+        self.assertEqual(_parse_estimated_cost("Estimated cost: $0.0123 USD"), 0.0123)  # noqa: PT009
+
+    def test_amounts_float_would_accept_are_rejected(self) -> None:
+        """Exponents, underscores and special values should not be read as costs."""
+        for amount in ("1e3", "nan", "inf", "1_000"):
+            with self.subTest(amount=amount):
+                self.assertIsNone(_parse_estimated_cost(f"Estimated cost: ${amount} USD"))  # noqa: PT009
+
+    def test_missing_currency_is_rejected(self) -> None:
+        """An amount without a trailing USD should be ignored."""
+        self.assertIsNone(_parse_estimated_cost("Estimated cost: $0.0123"))  # noqa: PT009
+
+    def test_missing_dollar_sign_is_rejected(self) -> None:
+        """An amount without a leading dollar sign should be ignored."""
+        self.assertIsNone(_parse_estimated_cost("Estimated cost: 0.0123 USD"))  # noqa: PT009
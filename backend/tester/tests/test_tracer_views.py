@@ -0,0 +1,247 @@
+"""Tests for the TRACER dashboard API views."""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+from django.db.models.query import QuerySet
+from django.db.utils import DatabaseError
+from django.http import FileResponse, HttpResponseBase
+from django.test import TestCase, override_settings
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from tester.api.tracer_views import get_tracer_analysis_report, get_tracer_executions, get_tracer_workflow_graph
+from tester.models import (
+    ChatbotConnector,
+    CustomUser,
+    OriginalTracerProfile,
+    ProfileExecution,
+    ProfileGenerationTask,
+    Project,
+    TracerAnalysisResult,
+)
+
+HTTP_OK = 200
+HTTP_NOT_MODIFIED = 304
+HTTP_NOT_FOUND = 404
+
+
+def legacy_execution_info(execution: ProfileExecution) -> dict:
+    """Build an executions list entry the way the view did before it streamed annotated rows."""
+    task = execution.generation_tasks.order_by("pk").first()
+    analysis = getattr(execution, "analysis_result", None)
+    return {
+        "id": execution.id,
+        "execution_name": execution.execution_name,
+        "project_name": execution.project.name,
+        "project_id": execution.project.id,
+        "status": execution.status,
+        "created_at": execution.created_at.isoformat(),
+        "sessions": execution.sessions,
+        "turns_per_session": execution.turns_per_session,
+        "verbosity": execution.verbosity,
+        "execution_time_minutes": execution.execution_time_minutes,
+        "generated_profiles_count": execution.generated_profiles_count,
+        "has_analysis": analysis is not None,
+        "analysis": None
+        if analysis is None
+        else {
+            "total_interactions": analysis.total_interactions,
+            "coverage_percentage": analysis.coverage_percentage,
+            "unique_paths_discovered": analysis.unique_paths_discovered,
+            "categories_count": analysis.categories_count,
+            "estimated_cost_usd": analysis.estimated_cost_usd,
+            "has_report": bool(analysis.report_file_path),
+            "has_graph": analysis.has_any_graph,
+            "available_formats": analysis.get_available_formats(),
+        },
+        "has_logs": bool(execution.tracer_stdout or execution.tracer_stderr),
+        "has_error": execution.status == "FAILURE",
+        "error_type": execution.error_type,
+        "error_message": (task.error_message or "") if task else "",
+        "has_profiles": execution.original_profiles.exists(),
+        "celery_task_id": task.celery_task_id if task else None,
+    }
+
+
+class TracerViewsTests(TestCase):
+    """Check the TRACER dashboard endpoints against stored executions."""
+
+    def setUp(self) -> None:
+        """Create a user, a project with two TRACER executions, and a temporary media root."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.media_root = Path(temp_dir.name)
+
+        override = override_settings(MEDIA_ROOT=self.media_root)
+        override.enable()
+        self.addCleanup(override.disable)
+
+        self.user = CustomUser.objects.create_user(email="owner@example.com")
+        connector = ChatbotConnector.objects.create(name="Primary Connector", technology="taskyto", owner=self.user)
+        self.project = Project.objects.create(name="Alpha", chatbot_connector=connector, owner=self.user)
+        self.request_factory = APIRequestFactory()
+
+        self.failed_execution = ProfileExecution.objects.create(
+            project=self.project,
+            execution_name="TRACER_1",
+            execution_type="tracer",
+            status="FAILURE",
+            error_type="OTHER",
+            profiles_directory="tracer_results/tracer_1",
+            tracer_stderr="Traceback ...",
+        )
+        ProfileGenerationTask.objects.create(
+            project=self.project,
+            execution=self.failed_execution,
+            status="FAILURE",
+            error_message="TRACER crashed",
+            celery_task_id="celery-1",
+        )
+
+        self.analysed_execution = ProfileExecution.objects.create(
+            project=self.project,
+            execution_name="TRACER_2",
+            execution_type="tracer",
+            status="SUCCESS",
+            sessions=3,
+            turns_per_session=8,
+            execution_time_minutes=4,
+            generated_profiles_count=2,
+            profiles_directory="tracer_results/tracer_2",
+        )
+        OriginalTracerProfile.objects.create(
+            execution=self.analysed_execution, original_filename="profile.yaml", original_content="test_name: A\n"
+        )
+        self.analysis = TracerAnalysisResult.objects.create(
+            execution=self.analysed_execution,
+            report_file_path="tracer_results/tracer_2/analysis/report.md",
+            workflow_graph_svg_path="tracer_results/tracer_2/analysis/workflow_graph.svg",
+            workflow_graph_pdf_path="tracer_results/tracer_2/analysis/workflow_graph.pdf",
+            total_interactions=40,
+            coverage_percentage=75.0,
+            unique_paths_discovered=6,
+            categories_count=3,
+            estimated_cost_usd=0.0368,
+        )
+
+    def get_executions(self) -> tuple[int, dict]:
+        """Request the executions list and decode its streamed body."""
+        request = self.request_factory.get("/api/tracer-executions/")
+        force_authenticate(request, user=self.user)
+        response = get_tracer_executions(request)
+        return response.status_code, json.loads(b"".join(response.streaming_content))
+
+    def test_streamed_executions_match_the_previous_response_shape(self) -> None:
+        """The streamed document should decode to the same executions the list view used to build."""
+        status_code, body = self.get_executions()
+
+        self.assertEqual(status_code, HTTP_OK)  # noqa: PT009
+        expected = [
+            legacy_execution_info(execution)
+            for execution in ProfileExecution.objects.filter(execution_type="tracer").order_by("-created_at")
+        ]
+        self.assertEqual(body, {"executions": expected})  # noqa: PT009
+
+        executions = {execution["id"]: execution for execution in body["executions"]}
+        analysed = executions[self.analysed_execution.id]
+        self.assertTrue(analysed["analysis"]["has_graph"])  # noqa: PT009
+        self.assertEqual(analysed["analysis"]["available_formats"], ["svg", "pdf"])  # noqa: PT009
+        self.assertFalse(analysed["has_logs"])  # noqa: PT009
+        self.assertTrue(analysed["has_profiles"])  # noqa: PT009
+        failed = executions[self.failed_execution.id]
+        self.assertTrue(failed["has_logs"])  # noqa: PT009
+        self.assertEqual(failed["error_message"], "TRACER crashed")  # noqa: PT009
+        self.assertEqual(failed["celery_task_id"], "celery-1")  # noqa: PT009
+
+    def test_database_error_while_streaming_closes_the_document(self) -> None:
+        """A failure after the first row should still produce valid JSON that reports the error."""
+        original_iterator = QuerySet.iterator
+
+        def fail_after_first_row(queryset: QuerySet, *args: object, **kwargs: object):  # noqa: ANN202
+            rows = original_iterator(queryset, *args, **kwargs)
+            yield next(rows)
+            msg = "connection lost"
+            raise DatabaseError(msg)
+
+        with patch.object(QuerySet, "iterator", fail_after_first_row):
+            status_code, body = self.get_executions()
+
+        self.assertEqual(status_code, HTTP_OK)  # noqa: PT009
+        self.assertEqual(len(body["executions"]), 1)  # noqa: PT009
+        self.assertIn("error", body)  # noqa: PT009
+
+    def get_report(self, **headers: str) -> HttpResponseBase:
+        """Request the analysed execution's report with the given request headers."""
+        request = self.request_factory.get(f"/api/tracer-analysis-report/{self.analysed_execution.id}/", **headers)
+        force_authenticate(request, user=self.user)
+        return get_tracer_analysis_report(request, execution_id=self.analysed_execution.id)
+
+    def test_report_etag_round_trip(self) -> None:
+        """Replaying the report's ETag should give a 304 until the file changes."""
+        report_path = self.media_root / self.analysis.report_file_path
+        report_path.parent.mkdir(parents=True)
+        report_path.write_text("# Report\n", encoding="utf-8")
+
+        response = self.get_report()
+        self.assertEqual(response.status_code, HTTP_OK)  # noqa: PT009
+        self.assertEqual(response.data["report_content"], "# Report\n")  # noqa: PT009
+        etag = response["ETag"]
+
+        response = self.get_report(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, HTTP_NOT_MODIFIED)  # noqa: PT009
+        self.assertEqual(response["ETag"], etag)  # noqa: PT009
+
+        file_stat = report_path.stat()
+        os.utime(report_path, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 1_000_000_000))
+
+        response = self.get_report(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, HTTP_OK)  # noqa: PT009
+        self.assertNotEqual(response["ETag"], etag)  # noqa: PT009
+
+    def test_report_if_none_match_star_is_not_modified(self) -> None:
+        """A wildcard If-None-Match header should match the existing report."""
+        report_path = self.media_root / self.analysis.report_file_path
+        report_path.parent.mkdir(parents=True)
+        report_path.write_text("# Report\n", encoding="utf-8")
+
+        response = self.get_report(HTTP_IF_NONE_MATCH="*")
+
+        self.assertEqual(response.status_code, HTTP_NOT_MODIFIED)  # noqa: PT009
+
+    def test_paths_outside_media_root_are_not_served(self) -> None:
+        """Stored report and graph paths that escape MEDIA_ROOT should give a 404 without reading the file."""
+        outside_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(outside_dir.cleanup)
+        secret_path = Path(outside_dir.name) / "secret.txt"
+        secret_path.write_text("top secret", encoding="utf-8")
+        escaping_paths = ("../../etc/passwd", os.path.relpath(secret_path, self.media_root), str(secret_path))
+
+        execution_id = self.analysed_execution.id
+        requests = (
+            ("report", get_tracer_analysis_report, {}),
+            ("report", get_tracer_analysis_report, {"raw": "1"}),
+            ("graph", get_tracer_workflow_graph, {}),
+            ("graph", get_tracer_workflow_graph, {"raw": "1"}),
+            ("graph", get_tracer_workflow_graph, {"graph_format": "png"}),
+        )
+        for stored_path in escaping_paths:
+            TracerAnalysisResult.objects.filter(pk=self.analysis.pk).update(
+                report_file_path=stored_path,
+                workflow_graph_svg_path=stored_path,
+                workflow_graph_png_path=stored_path,
+                workflow_graph_pdf_path="",
+            )
+            for endpoint, view, params in requests:
+                with self.subTest(path=stored_path, endpoint=endpoint, params=params):
+                    request = self.request_factory.get("/api/tracer/", params)
+                    force_authenticate(request, user=self.user)
+
+                    response = view(request, execution_id=execution_id)
+
+                    self.assertEqual(response.status_code, HTTP_NOT_FOUND)  # noqa: PT009
+                    self.assertNotIsInstance(response, FileResponse)  # noqa: PT009
+                    self.assertNotIn("top secret", json.dumps(response.data))  # noqa: PT009
+                    self.assertNotIn("root:", json.dumps(response.data))  # noqa: PT009